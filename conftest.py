@@ -2,36 +2,43 @@
 import logging
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 
 import pytest
-from playwright.sync_api import sync_playwright
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.utils.env_loader import load_env_files
-from src.utils.health_check import check_health
-from src.utils.jwt import setup_page_with_token
+from src.plugins.result_stream import ResultStream, TimingCollector
+from src.utils.health_check import check_health, is_health_check_skipped
+from src.utils.result_dir import RUN_DIR_KEY, create_run_dir, enforce_retention, get_max_result_bytes, is_test_run
 
 log = logging.getLogger(__name__)
 
+pytest_plugins = [
+    "src.plugins.browsers", "src.plugins.chaos", "src.plugins.flaky", "src.plugins.gate", "src.plugins.impact",
+    "src.plugins.profiling", "src.plugins.resources", "src.plugins.scheduler",
+]
+
 load_env_files()
 
 def pytest_sessionstart():
-    """pytest 세션 시작 시 서버 헬스 체크 수행"""
-    skip_health_check = os.getenv("SKIP_HEALTH_CHECK", "false").lower() == "true"
-    if skip_health_check:
+    """
+    pytest 세션 시작 시 백엔드 헬스 체크 수행
+
+    프론트엔드 헬스 체크와 web_page fixture는 Web 테스트가 수집될 때만
+    src/plugins/web.py 플러그인에서 수행됩니다.
+    """
+    if is_health_check_skipped():
         log.warning("[HEALTH] SKIP_HEALTH_CHECK=true 설정으로 헬스 체크를 건너뜁니다")
         return
     
     log.info("[HEALTH] 테스트 실행 전 서버 상태 점검 시작")
     backend_ok = check_health(os.getenv("BACKEND_BASE_URL"), expect_json=True)
-    frontend_ok = check_health(os.getenv("WEB_BASE_URL"), expect_json=False)
 
-    if not (backend_ok and frontend_ok):
+    if not backend_ok:
         msg = "[HEALTH] 서버 헬스 체크 실패로 테스트를 중단합니다"
         log.error(msg)
         pytest.exit(msg, returncode=1)
@@ -39,35 +46,36 @@ def pytest_sessionstart():
     log.info("[HEALTH] 서버 헬스 체크 통과")
 
 
-@pytest.fixture(scope="function")
-def web_page():
+def pytest_configure(config):
     """
-    Playwright 페이지 fixture
-    
-    JWT 토큰이 주입된 브라우저 페이지를 생성하여 각 테스트에 제공
-    
-    Yields:
-        Page: JWT 토큰이 설정된 Playwright Page 인스턴스
+    결과 디렉토리 생성 및 결과 스트림 플러그인 등록
+
+    테스트 결과는 Result/<timestamp>/results.jsonl에 테스트 단위로 기록되며,
+    HTML 리포트는 세션 종료 시 이 파일로부터 생성됩니다.
+    pytest-xdist worker는 controller가 만든 결과 디렉토리를 공유하고 결과 파일은 기록하지 않습니다.
+    --help, --collect-only 등 테스트를 실행하지 않는 호출에서는 결과 디렉토리를 만들지 않습니다.
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=os.getenv("HEADLESS", "true").lower() == "true")
-        context = browser.new_context()
-        jwt_token = os.getenv("JWT_TOKEN")
-        page = context.new_page()
-        setup_page_with_token(context, page, jwt_token)
+    config.pluginmanager.register(TimingCollector(), "timing_collector")
+    if hasattr(config, "workerinput"):
+        config.stash[RUN_DIR_KEY] = Path(config.workerinput["run_dir"])
+        return
+    if not is_test_run(config):
+        return
+    run_dir = create_run_dir()
+    config.stash[RUN_DIR_KEY] = run_dir
+    config.pluginmanager.register(ResultStream(run_dir), "result_stream")
 
-        yield page
-        context.close()
-        browser.close()
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist worker에 결과 디렉토리 전달"""
+    node.workerinput["run_dir"] = str(node.config.stash[RUN_DIR_KEY])
 
-def pytest_configure(config):
-    """pytest HTML 리포트 자동 생성 설정"""
-    if not getattr(config.option, "htmlpath", None):
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        result_base_dir = Path(__file__).resolve().parents[0] / "Result" / timestamp
-        result_base_dir.mkdir(parents=True, exist_ok=True)
-        report_path = result_base_dir / f"report_{timestamp}.html"
-
-        config.option.htmlpath = str(report_path)
-        config.option.self_contained_html = True
\ No newline at end of file
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """RESULT_MAX_MB 용량 제한에 맞춰 오래된 실행 결과부터 삭제"""
+    if hasattr(session.config, "workerinput"):
+        return
+    run_dir = session.config.stash.get(RUN_DIR_KEY, None)
+    enforce_retention(get_max_result_bytes(), keep=[run_dir] if run_dir else ())
@@ -1,27 +1,251 @@
 """requests를 사용한 API 테스트용 기본 API 클래스"""
+import codecs
+import json
 import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from json.decoder import WHITESPACE
 
 import requests
 
+from src.utils.chaos import install_chaos
+from src.utils.schema import get_registry
+from src.utils.timing import record_api_call
+
 log = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_TIMEOUT = 30.0
+# JSON 토큰이 끝났음을 나타내는 문자 (공백 / 구조 문자 / 문자열 시작)
+TOKEN_END = re.compile(r'[\s,:\[\]{}"]')
+
+
+def _is_truncated(text):
+    """
+    값 뒤에 이어지는 텍스트가 청크 경계에서 잘린 토큰일 수 있는지 확인 (내부 함수)
+
+    잘린 토큰(숫자 -45|00.0, 리터럴 tr|ue, \\u 이스케이프 등)에는 공백이나 구조 문자가 없으므로,
+    구조 문자가 이미 도착했다면 다음 청크를 기다려도 올바른 JSON이 될 수 없습니다.
+    """
+    return not TOKEN_END.search(text)
+
+
+def _iter_json_array(response, call, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    응답 본문의 최상위 JSON 배열을 항목 단위로 디코딩 (내부 함수)
+
+    청크를 받을 때마다 완성된 항목만 디코딩하고 나머지는 다음 청크와 이어 붙이므로
+    메모리 사용량은 본문 전체가 아닌 청크 크기와 항목 하나 크기로 제한됩니다.
+    json.loads와 같은 입력만 허용하며, 잘못된 항목은 본문 끝까지 기다리지 않고 해당 청크에서 실패합니다.
+    수신 시간, 수신 바이트, 디코딩 시간은 종료(또는 중단) 시 call 기록에 반영합니다.
+
+    Args:
+        response: stream=True로 받은 Response 객체
+        call: record_api_call이 반환한 기록
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Yields:
+        Any: 배열 항목
+
+    Raises:
+        json.JSONDecodeError: 본문이 JSON 배열이 아니거나(빈 항목 / 끝 쉼표 / 배열 뒤 데이터 포함)
+            배열이 끝나기 전에 본문이 끝난 경우
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    chunks = response.iter_content(chunk_size)
+    buffer, pos = "", 0
+    opened = closed = False
+    # 다음에 올 수 있는 토큰: first(항목 또는 "]"), value(항목), separator("," 또는 "]")
+    expect = "first"
+    read_ms = decode_ms = 0.0
+    received = 0
+    try:
+        final = False
+        while not final:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            read_ms += (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            final = chunk is None
+            if not final:
+                received += len(chunk)
+            buffer = buffer[pos:] + text.decode(chunk or b"", final=final)
+            pos = 0
+            items = []
+            while True:
+                pos = WHITESPACE.match(buffer, pos).end()
+                if pos >= len(buffer):
+                    break
+                char = buffer[pos]
+                if closed:
+                    raise json.JSONDecodeError("JSON 배열 뒤에 데이터가 있습니다", buffer, pos)
+                if not opened:
+                    if char != "[":
+                        raise json.JSONDecodeError("응답 본문이 JSON 배열이 아닙니다", buffer, pos)
+                    opened = True
+                    pos += 1
+                elif char == "]":
+                    if expect == "value":
+                        raise json.JSONDecodeError("JSON 배열이 쉼표로 끝났습니다", buffer, pos)
+                    closed = True
+                    pos += 1
+                elif char == ",":
+                    if expect != "separator":
+                        raise json.JSONDecodeError("JSON 배열에 값 없이 쉼표가 있습니다", buffer, pos)
+                    expect = "value"
+                    pos += 1
+                elif expect == "separator":
+                    raise json.JSONDecodeError("JSON 배열 구분자가 올바르지 않습니다", buffer, pos)
+                else:
+                    try:
+                        item, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        # 문자열이 본문 끝까지 이어지거나 실패 위치 뒤가 잘린 토큰이면 다음 청크를 기다림
+                        if not final and (e.msg.startswith("Unterminated string") or _is_truncated(buffer[e.pos:])):
+                            break
+                        raise
+                    following = WHITESPACE.match(buffer, end).end()
+                    if following >= len(buffer) or buffer[following] not in ",]":
+                        # 숫자(-45|00.0) 등 청크 경계에서 잘린 값일 수 있으므로 다음 청크를 기다림
+                        if not final and (following >= len(buffer) or _is_truncated(buffer[end:])):
+                            break
+                        raise json.JSONDecodeError("JSON 배열 구분자가 올바르지 않습니다", buffer, following)
+                    items.append(item)
+                    expect = "separator"
+                    pos = end
+            decode_ms += (time.perf_counter() - started) * 1000
+
+            yield from items
+        if not closed:
+            raise json.JSONDecodeError("JSON 배열이 끝나기 전에 응답 본문이 끝났습니다", buffer, len(buffer))
+    finally:
+        call["elapsed_ms"] = round(call["elapsed_ms"] + read_ms, 3)
+        call["bytes"] = received
+        call["decode_ms"] = round(decode_ms, 3)
+
 
 class BaseAPI:
     """API 페이지 객체의 기본 클래스"""
 
-    def __init__(self, base_url, headers=None):
+    def __init__(self, base_url, headers=None, validate_schema=None, timeout=None, record=True):
         """
         BaseAPI 초기화
 
+        chaos 시나리오(--chaos-scenario)가 적용 중이면 세션에 장애 주입 어댑터를 설치합니다.
+
         Args:
             base_url: API 기본 URL
             headers: 모든 요청에 포함할 선택적 헤더
+            validate_schema: 응답 스키마 검증 여부 (기본값: API_SCHEMA_VALIDATION 환경 변수, true)
+            timeout: 요청 timeout(초) (기본값: API_TIMEOUT 환경 변수, 30)
+            record: 응답 시간 기록 여부, False이면 호출 기록(results.jsonl / 실행 이력 인덱스)에서 제외하고
+                요청 로그를 DEBUG로 낮춤 (fixture 데이터 준비 / 정리용)
         """
         self.base_url = base_url.rstrip('/')
         self.headers = headers or {}
         self.session = requests.Session()
         if self.headers:
             self.session.headers.update(self.headers)
+        install_chaos(self.session)
+        if validate_schema is None:
+            validate_schema = os.getenv("API_SCHEMA_VALIDATION", "true").lower() == "true"
+        self.schema = get_registry() if validate_schema else None
+        self.timeout = float(timeout or os.getenv("API_TIMEOUT") or DEFAULT_TIMEOUT)
+        self.record = record
+        self.log_level = logging.INFO if record else logging.DEBUG
+
+    def _request(self, method, url, **kwargs):
+        """
+        요청 전송, 응답 시간 / 크기 기록(record=True인 경우) 및 응답 스키마 검증 (내부 메서드)
+
+        response.json()은 처음 호출될 때 디코딩 시간을 기록하고 결과를 재사용하므로
+        스키마 검증과 테스트 코드가 같은 본문을 두 번 디코딩하지 않습니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: requests 요청 옵션
+
+        Returns:
+            Response 객체
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if self.record:
+            call = record_api_call(method, url, response.status_code, elapsed_ms, len(response.content))
+            response.json = self._timed_json(response.json, call)
+        if self.schema is not None:
+            self.schema.validate_response(response)
+        return response
+
+    @staticmethod
+    def _timed_json(decode, call):
+        """
+        디코딩 시간을 기록하고 결과를 재사용하는 response.json 대체 함수 생성 (내부 메서드)
+
+        Args:
+            decode: 원래의 response.json
+            call: record_api_call이 반환한 기록
+
+        Returns:
+            Callable: response.json 대체 함수
+        """
+        decoded = []
+
+        def json_(**kwargs):
+            if kwargs:
+                return decode(**kwargs)
+            if not decoded:
+                started = time.perf_counter()
+                decoded.append(decode())
+                call["decode_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            return decoded[0]
+        return json_
+
+    def iter_json(self, endpoint, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        GET 응답의 JSON 배열을 항목 단위로 스트리밍 조회
+
+        본문 전체를 메모리에 올리지 않으므로 대용량 목록 / 부하 테스트에 사용합니다.
+        스키마 검증은 항목 단위로 수행하며, API 호출 기록의 elapsed_ms는 본문 수신 시간까지 포함하되
+        디코딩 시간(decode_ms)과 항목을 소비하는 테스트 코드의 시간은 제외합니다.
+
+        Args:
+            endpoint: API 엔드포인트
+            chunk_size: 한 번에 읽을 바이트 수
+
+        Yields:
+            Any: 배열 항목
+
+        Raises:
+            requests.HTTPError: 응답 상태 코드가 4xx / 5xx인 경우
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        log.info(f"GET {url} (stream)")
+        started = time.perf_counter()
+        response = self.session.get(url, stream=True, timeout=self.timeout)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        call = record_api_call("GET", url, response.status_code, elapsed_ms)
+        log.info(f"Response status: {response.status_code}")
+        with response:
+            response.raise_for_status()
+            check_item = None
+            if self.schema is not None:
+                check_item = self.schema.item_validator("GET", url, response.status_code)
+            count = 0
+            with closing(_iter_json_array(response, call, chunk_size)) as items:
+                for count, item in enumerate(items, start=1):
+                    if check_item is not None:
+                        check_item(count - 1, item)
+                    yield item
+        log.info(f"Streamed {count} items ({call['bytes']} bytes, decode {call['decode_ms']}ms)")
 
     def get(self, endpoint):
         """
@@ -34,9 +258,9 @@ class BaseAPI:
             Response 객체
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        log.info(f"GET {url}")
-        response = self.session.get(url)
-        log.info(f"Response status: {response.status_code}")
+        log.log(self.log_level, f"GET {url}")
+        response = self._request("GET", url)
+        log.log(self.log_level, f"Response status: {response.status_code}")
         return response
 
     def post(self, endpoint, payload=None, **kwargs):
@@ -52,11 +276,11 @@ class BaseAPI:
             Response 객체
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        log.info(f"POST {url}")
+        log.log(self.log_level, f"POST {url}")
         json_payload = kwargs.pop("json", payload)
         log.debug(f"Request data: {json_payload}")
-        response = self.session.post(url, json=json_payload, **kwargs)
-        log.info(f"Response status: {response.status_code}")
+        response = self._request("POST", url, json=json_payload, **kwargs)
+        log.log(self.log_level, f"Response status: {response.status_code}")
         return response
 
     def put(self, endpoint, payload=None, **kwargs):
@@ -72,11 +296,11 @@ class BaseAPI:
             Response 객체
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        log.info(f"PUT {url}")
+        log.log(self.log_level, f"PUT {url}")
         json_payload = kwargs.pop("json", payload)
         log.debug(f"Request data: {json_payload}")
-        response = self.session.put(url, json=json_payload, **kwargs)
-        log.info(f"Response status: {response.status_code}")
+        response = self._request("PUT", url, json=json_payload, **kwargs)
+        log.log(self.log_level, f"Response status: {response.status_code}")
         return response
 
     def delete(self, endpoint):
@@ -90,9 +314,9 @@ class BaseAPI:
             Response 객체
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        log.info(f"DELETE {url}")
-        response = self.session.delete(url)
-        log.info(f"Response status: {response.status_code}")
+        log.log(self.log_level, f"DELETE {url}")
+        response = self._request("DELETE", url)
+        log.log(self.log_level, f"Response status: {response.status_code}")
         return response
 
 
@@ -112,3 +336,112 @@ class LoginAPI(BaseAPI):
         """
         endpoint = f"api/auth/{provider}"
         return self.post(endpoint, json={"accessToken": access_token})
+
+
+class TodoAPI(BaseAPI):
+    """할일 API"""
+
+    ENDPOINT = "api/todos"
+
+    def get_todos(self):
+        """
+        할일 목록 조회
+
+        Returns:
+            Response 객체
+        """
+        return self.get(self.ENDPOINT)
+
+    def iter_todos(self, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        할일 목록 스트리밍 조회
+
+        Args:
+            chunk_size: 한 번에 읽을 바이트 수
+
+        Yields:
+            dict: 할일
+        """
+        yield from self.iter_json(self.ENDPOINT, chunk_size)
+
+    def create_todo(self, title, completed=False, **fields):
+        """
+        할일 생성
+
+        Args:
+            title: 할일 제목
+            completed: 완료 여부
+            **fields: 추가 필드 (description 등)
+
+        Returns:
+            Response 객체
+        """
+        return self.post(self.ENDPOINT, {"title": title, "completed": completed, **fields})
+
+    def delete_todo(self, todo_id):
+        """
+        할일 삭제
+
+        Args:
+            todo_id: 할일 ID
+
+        Returns:
+            Response 객체
+        """
+        return self.delete(f"{self.ENDPOINT}/{todo_id}")
+
+    def seed_todos(self, count, title_prefix="Seed Todo", workers=8):
+        """
+        할일 대량 생성
+
+        worker별 TodoAPI 인스턴스(스키마 검증 없음)의 create_todo로 병렬 생성하며 chaos 장애 주입은 그대로 적용됩니다.
+        데이터 준비용 요청이므로 응답 시간 기록에서 제외하고(record=False) 개별 요청 로그는 DEBUG로 남깁니다.
+
+        Args:
+            count: 생성할 개수
+            title_prefix: 제목 접두어
+            workers: 동시 요청 수
+
+        Returns:
+            list: 생성된 할일 ID 목록
+        """
+        def create_chunk(indexes):
+            api = TodoAPI(self.base_url, self.headers, validate_schema=False, record=False)
+            ids = []
+            for index in indexes:
+                response = api.create_todo(f"{title_prefix} {index}")
+                response.raise_for_status()
+                ids.append(response.json()["id"])
+            return ids
+
+        workers = max(1, min(workers, count))
+        chunks = [range(start, count, workers) for start in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            created = [todo_id for ids in pool.map(create_chunk, chunks) for todo_id in ids]
+        log.info(f"Seeded {len(created)} todos")
+        return created
+
+    def delete_todos(self, todo_ids, workers=8):
+        """
+        할일 대량 삭제
+
+        worker별 TodoAPI 인스턴스(스키마 검증 없음)의 delete_todo로 병렬 삭제합니다.
+        seed_todos와 마찬가지로 응답 시간 기록에서 제외하고 개별 요청 로그는 DEBUG로 남깁니다.
+
+        Args:
+            todo_ids: 삭제할 할일 ID 목록
+            workers: 동시 요청 수
+        """
+        def delete_chunk(ids):
+            api = TodoAPI(self.base_url, self.headers, validate_schema=False, record=False)
+            for todo_id in ids:
+                api.delete_todo(todo_id)
+
+        todo_ids = list(todo_ids)
+        if not todo_ids:
+            return
+        workers = max(1, min(workers, len(todo_ids)))
+        chunks = [todo_ids[start::workers] for start in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(delete_chunk, chunks))
+        log.info(f"Deleted {len(todo_ids)} todos")
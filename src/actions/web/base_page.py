@@ -1,5 +1,8 @@
 """Playwright를 사용한 웹 테스트용 기본 페이지 클래스"""
 import logging
+import time
+
+from src.utils.timing import record_web_timing
 
 log = logging.getLogger(__name__)
 
@@ -78,7 +81,9 @@ class BasePage:
         Args:
             url: 이동할 URL
         """
+        started = time.perf_counter()
         self.page.goto(url)
+        record_web_timing("navigate", url, (time.perf_counter() - started) * 1000)
         log.info(f"Navigated to: {url}")
 
     def wait_for_load_state(self, state="load"):
@@ -88,5 +93,7 @@ class BasePage:
         Args:
             state: 대기할 로드 상태 (load, domcontentloaded, networkidle)
         """
+        started = time.perf_counter()
         self.page.wait_for_load_state(state)
+        record_web_timing("load_state", state, (time.perf_counter() - started) * 1000)
         log.debug(f"Page load state: {state}")
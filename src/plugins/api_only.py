@@ -0,0 +1,48 @@
+"""API 전용 실행 프로파일
+
+Web 테스트 모듈을 import하지 않고 API 테스트만 수집하여 Playwright import와
+프론트엔드 헬스 체크 비용 없이 세션을 시작합니다.
+
+    pytest -p src.plugins.api_only
+"""
+import logging
+
+log = logging.getLogger(__name__)
+
+WEB_PLUGIN = "src.plugins.web"
+WEB_FIXTURE = "web_page"
+
+
+def _requires_web(path):
+    """
+    Web 플러그인을 요구하는 테스트 모듈인지 확인
+
+    Args:
+        path: 테스트 모듈 경로
+
+    Returns:
+        bool: Web 플러그인 선언 여부
+    """
+    try:
+        return WEB_PLUGIN in path.read_text(encoding="utf-8")
+    except OSError:
+        return False
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Web 테스트 모듈은 import 전에 수집 대상에서 제외"""
+    if collection_path.suffix == ".py" and collection_path.name.startswith("test_"):
+        if _requires_web(collection_path):
+            log.debug(f"[API-ONLY] Web 테스트 모듈 제외: {collection_path}")
+            return True
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    """다른 경로로 수집된 Web 테스트 항목 제외"""
+    selected, deselected = [], []
+    for item in items:
+        (deselected if WEB_FIXTURE in getattr(item, "fixturenames", ()) else selected).append(item)
+    if deselected:
+        items[:] = selected
+        config.hook.pytest_deselected(items=deselected)
@@ -0,0 +1,256 @@
+"""브라우저 매트릭스(Chromium / Firefox / WebKit) 실행 플러그인
+
+--browsers 옵션(또는 BROWSERS 환경 변수)으로 여러 엔진을 지정하면 web_page를 사용하는 테스트를
+엔진별로 파라미터화합니다(test_x[firefox]). 지정하지 않으면 기존처럼 Chromium으로 한 번만 실행합니다.
+Playwright를 import하지 않으므로 conftest.py에서 항상 로드됩니다.
+
+- 각 프로세스는 엔진별 브라우저를 한 번만 실행해 재사용하고(src/plugins/web.py 브라우저 풀),
+  테스트마다 새 브라우저 컨텍스트를 만듭니다.
+- 실행 이력 인덱스의 평균 실행 시간 기준으로 긴 테스트부터, 엔진을 번갈아 가며 실행 순서를 정합니다.
+  pytest-xdist(-n N)와 함께 실행하면 고정된 N개 worker에 엔진별 작업이 고르게 나뉩니다.
+- 엔진별 테스트 수 / 실패 수 / 실행 시간을 터미널 요약과 HTML 리포트에 표시합니다.
+
+    pytest --browsers all -n 4
+    BROWSERS=chromium,firefox pytest tests/test_web.py
+"""
+import logging
+import os
+import statistics
+from collections import defaultdict
+
+import pytest
+
+from src.utils.result_dir import INDEX_PATH
+
+log = logging.getLogger(__name__)
+
+BROWSER_ENGINES = ("chromium", "firefox", "webkit")
+DEFAULT_BROWSER = "chromium"
+BROWSER_FIXTURE = "browser_name"
+BROWSER_PROPERTY = "browser"
+DURATION_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    """브라우저 매트릭스 옵션 등록"""
+    group = parser.getgroup("browsers", "브라우저 매트릭스")
+    group.addoption("--browsers", default=os.getenv("BROWSERS"),
+                    help="Web 테스트를 실행할 엔진 (쉼표 구분 chromium,firefox,webkit 또는 all, 기본값: chromium 단일 실행)")
+    group.addoption("--duration-window", type=int, default=30,
+                    help="실행 순서 계산에 사용할 최근 실행 수 (기본값: 30)")
+
+
+def get_browsers(config):
+    """
+    매트릭스 실행 대상 엔진 목록 반환
+
+    Args:
+        config: pytest Config 인스턴스
+
+    Returns:
+        list[str]: 엔진 목록, 매트릭스 모드가 아니면 빈 목록
+
+    Raises:
+        pytest.UsageError: 지원하지 않는 엔진이 지정된 경우
+    """
+    value = (config.getoption("browsers") or "").strip().lower()
+    if not value:
+        return []
+    if value == "all":
+        return list(BROWSER_ENGINES)
+    engines = list(dict.fromkeys(engine.strip() for engine in value.split(",") if engine.strip()))
+    unknown = [engine for engine in engines if engine not in BROWSER_ENGINES]
+    if unknown:
+        raise pytest.UsageError(f"지원하지 않는 브라우저: {', '.join(unknown)} (지원: {', '.join(BROWSER_ENGINES)})")
+    return engines
+
+
+def get_item_browser(item):
+    """
+    테스트가 사용하는 브라우저 엔진 반환
+
+    Args:
+        item: pytest Item
+
+    Returns:
+        str | None: 엔진 이름, Web 테스트가 아니면 None
+    """
+    if BROWSER_FIXTURE not in getattr(item, "fixturenames", ()):
+        return None
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and BROWSER_FIXTURE in callspec.params:
+        return callspec.params[BROWSER_FIXTURE]
+    return DEFAULT_BROWSER
+
+
+def strip_browser_param(nodeid):
+    """
+    nodeid에서 브라우저 엔진 파라미터 제거
+
+    매트릭스 실행(test_x[firefox], test_x[10-webkit])과 단일 실행(test_x, test_x[10])의 기록을
+    같은 테스트로 다룰 때 사용합니다.
+
+    Args:
+        nodeid: 테스트 nodeid
+
+    Returns:
+        str: 엔진 파라미터를 제외한 nodeid
+    """
+    base, sep, params = nodeid.partition("[")
+    if not sep or not params.endswith("]"):
+        return nodeid
+    ids = [part for part in params[:-1].split("-") if part not in BROWSER_ENGINES]
+    return f"{base}[{'-'.join(ids)}]" if ids else base
+
+
+def pytest_configure(config):
+    """엔진 옵션 검증 및 엔진별 실행 시간 집계 플러그인 등록"""
+    engines = get_browsers(config)
+    if engines and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(BrowserBreakdown(), "browser_breakdown")
+
+
+def pytest_generate_tests(metafunc):
+    """매트릭스 모드에서 web_page를 사용하는 테스트를 엔진별로 파라미터화"""
+    engines = get_browsers(metafunc.config)
+    if engines and BROWSER_FIXTURE in metafunc.fixturenames:
+        metafunc.parametrize(BROWSER_FIXTURE, engines, ids=engines)
+
+
+def load_durations(config):
+    """실행 이력 인덱스에서 테스트별 평균 실행 시간 조회"""
+    if not INDEX_PATH.exists():
+        return {}
+    import sqlite3
+
+    from src.reporting.run_index import RunIndex
+
+    try:
+        with RunIndex(INDEX_PATH) as index:
+            return index.average_durations(config.getoption("duration_window"))
+    except sqlite3.Error as e:
+        log.warning(f"[BROWSER] 실행 이력 인덱스 조회 실패: {e}")
+        return {}
+
+
+def estimate_durations(nodeids, durations):
+    """
+    테스트별 예상 실행 시간 계산
+
+    이력이 없는 테스트(새 엔진 파라미터 등)는 같은 테스트 함수의 다른 파라미터 평균,
+    그것도 없으면 전체 이력의 중앙값을 사용합니다.
+
+    Args:
+        nodeids: 테스트 nodeid 목록
+        durations: nodeid별 평균 실행 시간
+
+    Returns:
+        dict[str, float]: nodeid별 예상 실행 시간(초)
+    """
+    by_function = defaultdict(list)
+    for nodeid, duration in durations.items():
+        by_function[nodeid.split("[", 1)[0]].append(duration)
+    fallback = statistics.median(durations.values()) if durations else 0.0
+
+    estimates = {}
+    for nodeid in nodeids:
+        duration = durations.get(nodeid)
+        if duration is None:
+            siblings = by_function.get(nodeid.split("[", 1)[0])
+            duration = sum(siblings) / len(siblings) if siblings else fallback
+        estimates[nodeid] = duration
+    return estimates
+
+
+def has_scoped_params(item):
+    """module / session scope 파라미터 fixture 사용 여부 (순서를 바꾸면 fixture가 반복 생성됨)"""
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return False
+    fixturedefs = item._fixtureinfo.name2fixturedefs
+    return any(name in fixturedefs and fixturedefs[name][-1].scope != "function" for name in callspec.params)
+
+
+def order_longest_first(items):
+    """
+    엔진을 번갈아 가며 긴 테스트부터 실행하도록 정렬
+
+    엔진(API 테스트는 별도 그룹)별로 예상 실행 시간 내림차순 순위를 매긴 뒤 순위, 예상 시간 순으로
+    정렬하여 각 엔진의 가장 긴 테스트가 먼저 분배되도록 합니다. scope가 넓은 파라미터 fixture를
+    사용하는 테스트는 fixture 재사용을 위해 원래 순서대로 마지막에 둡니다.
+
+    Args:
+        items: 예상 실행 시간(DURATION_KEY)이 저장된 pytest Item 목록
+
+    Returns:
+        list: 정렬된 Item 목록
+    """
+    pinned = [item for item in items if has_scoped_params(item)]
+    groups = defaultdict(list)
+    for item in items:
+        if not has_scoped_params(item):
+            groups[get_item_browser(item)].append(item)
+
+    ranked = []
+    for group in groups.values():
+        group.sort(key=lambda item: item.stash[DURATION_KEY], reverse=True)
+        ranked.extend((rank, -item.stash[DURATION_KEY], item) for rank, item in enumerate(group))
+    ranked.sort(key=lambda entry: entry[:2])
+    return [item for _, _, item in ranked] + pinned
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """엔진 정보 기록 및 매트릭스 모드 실행 순서 결정 (격리 테스트 분리 전에 수행)"""
+    for item in items:
+        browser = get_item_browser(item)
+        if browser:
+            item.user_properties.append((BROWSER_PROPERTY, browser))
+
+    if not get_browsers(config):
+        return
+    estimates = estimate_durations([item.nodeid for item in items], load_durations(config))
+    for item in items:
+        item.stash[DURATION_KEY] = estimates[item.nodeid]
+    items[:] = order_longest_first(items)
+    log.info(f"[BROWSER] 예상 실행 시간 기준 정렬 완료: {len(items)}건, 예상 합계 {sum(estimates.values()):.1f}s")
+
+
+class BrowserBreakdown:
+    """엔진별 테스트 수 / 실패 수 / 실행 시간을 집계하여 터미널 요약에 출력하는 플러그인"""
+
+    def __init__(self):
+        """BrowserBreakdown 초기화"""
+        self.stats = {}
+        self._durations = defaultdict(float)
+        self._failed = set()
+
+    def pytest_runtest_logreport(self, report):
+        """엔진별 실행 시간 누적 (재실행 시도 포함), 최종 시도 기준으로 결과 집계"""
+        browser = dict(report.user_properties).get(BROWSER_PROPERTY)
+        if browser is None:
+            return
+        final = not getattr(report, "will_rerun", False)
+        self._durations[report.nodeid] += report.duration
+        if report.failed and final:
+            self._failed.add(report.nodeid)
+        if report.when != "teardown" or not final:
+            return
+
+        stats = self.stats.setdefault(browser, {"tests": 0, "failed": 0, "duration": 0.0, "max": 0.0})
+        duration = self._durations.pop(report.nodeid)
+        stats["tests"] += 1
+        stats["failed"] += report.nodeid in self._failed
+        stats["duration"] += duration
+        stats["max"] = max(stats["max"], duration)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """엔진별 실행 시간 요약 출력"""
+        if not self.stats:
+            return
+        terminalreporter.write_sep("-", "browser breakdown")
+        terminalreporter.write_line(f"{'browser':<10}{'tests':>7}{'failed':>8}{'total_s':>10}{'avg_s':>8}{'max_s':>8}")
+        for browser, stats in sorted(self.stats.items()):
+            terminalreporter.write_line(
+                f"{browser:<10}{stats['tests']:>7}{stats['failed']:>8}{stats['duration']:>10.2f}"
+                f"{stats['duration'] / stats['tests']:>8.2f}{stats['max']:>8.2f}")
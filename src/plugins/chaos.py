@@ -0,0 +1,111 @@
+"""장애 / 지연 주입(chaos) 실행 플러그인
+
+--chaos-scenario(또는 CHAOS_SCENARIO 환경 변수)로 chaos/scenarios.json의 시나리오를 지정하면
+BaseAPI 요청과 web_page 페이지 요청에 규칙에 따라 지연, 지터, 연결 끊김, 5xx 응답을 주입합니다.
+
+- 테스트별 주입 횟수와 총 지연은 results.jsonl의 properties.chaos에 기록됩니다.
+- chaos 실행은 실행 이력 인덱스에 시나리오 이름과 함께 적재되어 일반 조회 / Flaky 판단 / 스케줄링에서 제외되고,
+  세션 종료 시 일반 실행 대비 테스트별 실행 시간 / 통과율 저하를 터미널에 출력합니다.
+
+    pytest --chaos-scenario slow_backend
+    python -m src.reporting.run_index chaos slow_backend
+"""
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from src.plugins.result_stream import SESSION_PROPERTIES_KEY
+from src.utils.chaos import SCENARIO_PATH, activate, drain_faults, load_scenario
+from src.utils.result_dir import INDEX_PATH, get_run_dir
+
+log = logging.getLogger(__name__)
+
+CHAOS_PROPERTY = "chaos"
+EXCESS_THRESHOLD_S = 1.0
+SUMMARY_LIMIT = 20
+
+
+def pytest_addoption(parser):
+    """chaos 옵션 등록"""
+    group = parser.getgroup("chaos", "장애 / 지연 주입")
+    group.addoption("--chaos-scenario", default=os.getenv("CHAOS_SCENARIO") or None,
+                    help="적용할 chaos 시나리오 이름 (chaos/scenarios.json)")
+    group.addoption("--chaos-file", default=str(SCENARIO_PATH),
+                    help="chaos 시나리오 파일 경로 (기본값: chaos/scenarios.json)")
+
+
+def pytest_configure(config):
+    """시나리오를 로드하여 현재 프로세스에 적용하고 주입 기록 플러그인 등록"""
+    name = config.getoption("chaos_scenario")
+    if not name:
+        return
+    try:
+        scenario = load_scenario(name, Path(config.getoption("chaos_file")))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise pytest.UsageError(f"chaos 시나리오 로드 실패: {e}")
+    activate(scenario)
+    config.stash.setdefault(SESSION_PROPERTIES_KEY, {})["chaos_scenario"] = name
+    config.pluginmanager.register(ChaosRecorder(scenario), "chaos_recorder")
+    log.warning(f"[CHAOS] 시나리오 적용: {name} - {scenario.description}")
+
+
+class ChaosRecorder:
+    """테스트별 장애 주입 내역을 기록하고 일반 실행 대비 저하를 요약하는 플러그인"""
+
+    def __init__(self, scenario):
+        """
+        ChaosRecorder 초기화
+
+        Args:
+            scenario: 적용 중인 ChaosScenario
+        """
+        self.scenario = scenario
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """teardown 리포트에 테스트 동안 주입한 장애 요약 첨부"""
+        report = yield
+        if call.when == "teardown":
+            report.user_properties.append((CHAOS_PROPERTY, {"scenario": self.scenario.name, **drain_faults()}))
+        return report
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        """이번 실행의 테스트별 실행 시간 / 통과율 저하 출력 (결과가 인덱스에 적재된 뒤 실행)"""
+        run_dir = get_run_dir(config)
+        if hasattr(config, "workerinput") or run_dir is None or not INDEX_PATH.exists():
+            return
+        import sqlite3
+
+        from src.reporting.run_index import RunIndex
+
+        try:
+            with RunIndex(INDEX_PATH) as index:
+                rows = index.chaos_degradation(run_id=run_dir.name)
+        except sqlite3.Error as e:
+            log.warning(f"[CHAOS] 실행 이력 인덱스 조회 실패: {e}")
+            return
+        if not rows:
+            return
+
+        terminalreporter.write_sep("-", f"chaos degradation: {self.scenario.name}")
+        terminalreporter.write_line(
+            f"{'base_s':>8}{'chaos_s':>9}{'inject_s':>9}{'excess_s':>9}{'pass':>11}  verdict  nodeid")
+        for nodeid, base_s, chaos_s, injected_s, excess_s, base_pass, chaos_pass in rows[:SUMMARY_LIMIT]:
+            if base_s is None:
+                verdict, base_text, excess_text, base_pass_text = "no-base", "-", "-", "-"
+            else:
+                base_text, excess_text, base_pass_text = f"{base_s:.2f}", f"{excess_s:.2f}", f"{base_pass:.0%}"
+                if chaos_pass < base_pass:
+                    verdict = "tight"
+                elif excess_s > EXCESS_THRESHOLD_S:
+                    verdict = "slack"
+                else:
+                    verdict = "ok"
+            terminalreporter.write_line(
+                f"{base_text:>8}{chaos_s:>9.2f}{injected_s:>9.2f}{excess_text:>9}"
+                f"{base_pass_text:>5}->{chaos_pass:>4.0%}  {verdict:<7}  {nodeid}")
+        terminalreporter.write_line(
+            "tight: 지연/오류에서 통과율 하락 (timeout / 재시도 예산 부족), "
+            f"slack: 주입 지연보다 {EXCESS_THRESHOLD_S:g}s 이상 더 느려짐 (고정 대기 / 폴링 간격 과다)")
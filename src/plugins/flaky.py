@@ -0,0 +1,159 @@
+"""Flaky 테스트 재실행 및 격리(quarantine) 플러그인
+
+- 실패한 테스트만 즉시 재실행합니다. function scope fixture(web_page 등)는 시도마다 새로 생성되므로
+  재실행은 새 브라우저 컨텍스트에서 수행됩니다.
+- 재실행 후 통과한 기록은 results.jsonl의 attempts로 남고 실행 이력 인덱스에 누적됩니다.
+- 최근 실행에서 재실행 후 통과 비율이 임계값 이상인 테스트는 격리 대상으로 분류되어
+  세션 마지막에 실행되며, 실패해도 세션 결과를 실패로 만들지 않습니다.
+
+    pytest --flaky-reruns 2
+    pytest --flaky-reruns 2 --quarantine skip     # 차단 lane: 격리 테스트 제외
+    pytest --quarantine only                      # 비차단 lane: 격리 테스트만 실행
+"""
+import logging
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from src.utils.result_dir import INDEX_PATH
+
+log = logging.getLogger(__name__)
+
+QUARANTINE_MARKER = "quarantine"
+
+
+def pytest_addoption(parser):
+    """재실행 / 격리 옵션 등록"""
+    group = parser.getgroup("flaky", "Flaky 테스트 재실행 / 격리")
+    group.addoption("--flaky-reruns", type=int, default=0,
+                    help="실패한 테스트의 최대 재실행 횟수 (기본값: 0)")
+    group.addoption("--flaky-threshold", type=float, default=0.3,
+                    help="격리 기준 재실행 후 통과 비율 (기본값: 0.3)")
+    group.addoption("--flaky-window", type=int, default=30,
+                    help="Flaky 비율 계산에 사용할 최근 실행 수 (기본값: 30)")
+    group.addoption("--flaky-min-runs", type=int, default=5,
+                    help="격리 판단에 필요한 최소 실행 횟수 (기본값: 5)")
+    group.addoption("--quarantine", choices=("run", "skip", "only", "off"), default="run",
+                    help="격리 테스트 처리: run(비차단 실행), skip(제외), only(격리 테스트만), off(격리 안 함)")
+
+
+def pytest_configure(config):
+    """quarantine 마커 및 격리 결과 추적 플러그인 등록"""
+    config.addinivalue_line("markers", f"{QUARANTINE_MARKER}: 비차단 lane에서 실행되는 Flaky 테스트")
+    config.pluginmanager.register(QuarantineTracker(), "quarantine_tracker")
+
+
+def _load_flake_rates(config):
+    """실행 이력 인덱스에서 테스트별 Flaky 비율 조회"""
+    if not INDEX_PATH.exists():
+        return {}
+    import sqlite3
+
+    from src.reporting.run_index import RunIndex
+
+    try:
+        with RunIndex(INDEX_PATH) as index:
+            return index.flake_rates(config.getoption("flaky_window"), config.getoption("flaky_min_runs"))
+    except sqlite3.Error as e:
+        log.warning(f"[FLAKY] 실행 이력 인덱스 조회 실패: {e}")
+        return {}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Flaky 비율이 임계값 이상인 테스트를 격리 lane으로 분류"""
+    mode = config.getoption("quarantine")
+    if mode == "off":
+        return
+
+    threshold = config.getoption("flaky_threshold")
+    rates = _load_flake_rates(config)
+    regular, quarantined = [], []
+    for item in items:
+        rate = rates.get(item.nodeid, 0.0)
+        if rate >= threshold or item.get_closest_marker(QUARANTINE_MARKER):
+            item.add_marker(QUARANTINE_MARKER)
+            item.user_properties.append(("quarantined", round(rate, 3)))
+            quarantined.append(item)
+        else:
+            regular.append(item)
+
+    if quarantined:
+        log.info(f"[FLAKY] 격리 테스트 {len(quarantined)}건: {', '.join(item.nodeid for item in quarantined)}")
+
+    # only는 격리 테스트가 없어도 일반 테스트를 모두 제외 (비차단 lane이 전체 테스트를 다시 실행하지 않도록)
+    if mode == "skip":
+        items[:] = regular
+        if quarantined:
+            config.hook.pytest_deselected(items=quarantined)
+    elif mode == "only":
+        items[:] = quarantined
+        if regular:
+            config.hook.pytest_deselected(items=regular)
+    else:
+        items[:] = regular + quarantined
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """실패한 시도를 재실행 표시(rerun)로 보고하고 통과하거나 횟수가 소진될 때까지 재실행"""
+    reruns = item.config.getoption("flaky_reruns")
+    if reruns <= 0:
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for attempt in range(1, reruns + 2):
+        if attempt > 1:
+            item._initrequest()
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        will_rerun = attempt <= reruns and any(report.failed for report in reports)
+        for report in reports:
+            report.attempt = attempt
+            report.will_rerun = will_rerun
+            if will_rerun and report.failed:
+                report.outcome = "rerun"
+            item.ihook.pytest_runtest_logreport(report=report)
+        if not will_rerun:
+            break
+        log.warning(f"[FLAKY] 재실행 {attempt}/{reruns}: {item.nodeid}")
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    """재실행 예정 시도의 터미널 표시"""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    return None
+
+
+class QuarantineTracker:
+    """격리 테스트 실패를 세션 결과에서 제외하기 위해 최종 실패를 분류하는 플러그인"""
+
+    def __init__(self):
+        """QuarantineTracker 초기화"""
+        self.quarantined_failures = set()
+        self.blocking_failures = set()
+
+    def pytest_runtest_logreport(self, report):
+        """최종 시도의 실패를 격리 여부에 따라 분류"""
+        if not report.failed or getattr(report, "will_rerun", False):
+            return
+        if QUARANTINE_MARKER in report.keywords:
+            self.quarantined_failures.add(report.nodeid)
+        else:
+            self.blocking_failures.add(report.nodeid)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        """격리 테스트만 실패한 경우 세션 결과를 성공으로 처리"""
+        if (exitstatus == pytest.ExitCode.TESTS_FAILED and self.quarantined_failures
+                and not self.blocking_failures):
+            log.warning(f"[FLAKY] 격리 테스트 실패 {len(self.quarantined_failures)}건은 세션 결과에 반영하지 않습니다")
+            session.exitstatus = pytest.ExitCode.OK
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """격리 테스트 실패 목록 출력"""
+        if self.quarantined_failures:
+            terminalreporter.write_sep("-", "quarantined failures (non-blocking)", yellow=True)
+            for nodeid in sorted(self.quarantined_failures):
+                terminalreporter.write_line(nodeid)
@@ -0,0 +1,157 @@
+"""배포 게이트(스모크) 실행 플러그인
+
+--gate로 실행하면 smoke 마커가 붙은 핵심 경로 테스트(헬스, /api/auth/me, 할일 목록, 메인 화면 렌더링)만
+짧은 timeout으로 실행하고, 실패가 하나라도 나오면 즉시 중단하여 배포 판단을 최대한 빨리 내립니다.
+게이트를 통과한 경우에만 파이프라인이 전체 테스트를 이어서 실행합니다.
+
+- 실행 순서는 실행 이력 인덱스의 최근 실패 이력 기준 "실행 시간 대비 실패 검출 확률"이 높은 테스트부터입니다.
+  실패 확률은 (실패 횟수 + 1) / (실행 횟수 + 2)로 계산하여 이력이 없는 테스트도 중간 우선순위를 갖습니다.
+- BaseAPI 요청(API_TIMEOUT)과 Playwright 동작(WEB_TIMEOUT_MS)의 timeout을 --gate-timeout으로 낮춥니다.
+- pytest-xdist(-n N)와 함께 실행하면 실행 이력 기반 LPT 분배 대신 위 우선순위 순서대로 분배합니다.
+- 격리(quarantine)된 Flaky 테스트의 실패는 게이트를 중단시키지 않습니다.
+
+    pytest --gate -n 4 && pytest -n 4
+"""
+import logging
+import os
+import statistics
+import time
+
+import pytest
+
+from src.plugins.flaky import QUARANTINE_MARKER
+from src.utils.result_dir import INDEX_PATH
+
+log = logging.getLogger(__name__)
+
+SMOKE_MARKER = "smoke"
+MIN_DURATION = 0.05
+
+
+def pytest_addoption(parser):
+    """배포 게이트 옵션 등록"""
+    group = parser.getgroup("gate", "배포 게이트")
+    group.addoption("--gate", action="store_true", default=False,
+                    help="smoke 테스트만 실패 검출 우선순위 순서로 실행하고 첫 실패에서 중단")
+    group.addoption("--gate-timeout", type=float, default=5.0,
+                    help="게이트 실행 시 API 요청 / Playwright 동작 timeout(초) (기본값: 5)")
+    group.addoption("--gate-window", type=int, default=30,
+                    help="우선순위 계산에 사용할 최근 실행 수 (기본값: 30)")
+
+
+def pytest_configure(config):
+    """게이트 모드이면 timeout을 낮추고 첫 실패 중단 플러그인 등록"""
+    if not config.getoption("gate"):
+        return
+    timeout = config.getoption("gate_timeout")
+    os.environ["API_TIMEOUT"] = str(timeout)
+    os.environ["WEB_TIMEOUT_MS"] = str(int(timeout * 1000))
+    # 실행 시간 기반 LPT 분배는 우선순위 순서를 무시하므로 xdist 기본 분배 사용
+    config.option.schedule = "xdist"
+    config.pluginmanager.register(GateGuard(config), "gate_guard")
+    if not hasattr(config, "workerinput"):
+        log.warning(f"[GATE] 배포 게이트 모드: smoke 테스트만 timeout {timeout:g}s로 실행, 첫 실패에서 중단")
+
+
+def _load_failure_stats(config):
+    """실행 이력 인덱스에서 테스트별 실행 / 실패 횟수와 평균 실행 시간 조회"""
+    if not INDEX_PATH.exists():
+        return {}
+    import sqlite3
+
+    from src.reporting.run_index import RunIndex
+
+    try:
+        with RunIndex(INDEX_PATH) as index:
+            return index.failure_stats(config.getoption("gate_window"))
+    except sqlite3.Error as e:
+        log.warning(f"[GATE] 실행 이력 인덱스 조회 실패: {e}")
+        return {}
+
+
+def detection_priority(nodeids, stats):
+    """
+    실행 시간 대비 실패 검출 확률 계산
+
+    Args:
+        nodeids: 테스트 nodeid 목록
+        stats: nodeid별 (실행 횟수, 실패 횟수, 평균 실행 시간)
+
+    Returns:
+        dict[str, float]: nodeid별 초당 실패 검출 확률, 클수록 먼저 실행
+    """
+    durations = [duration for _, _, duration in stats.values() if duration is not None]
+    fallback = statistics.median(durations) if durations else 1.0
+
+    priority = {}
+    for nodeid in nodeids:
+        runs, failures, duration = stats.get(nodeid, (0, 0, None))
+        rate = (failures + 1) / (runs + 2)
+        priority[nodeid] = rate / max(duration if duration is not None else fallback, MIN_DURATION)
+    return priority
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """smoke 테스트만 남기고 실패 검출 우선순위 순서로 정렬 (격리 테스트는 마지막)"""
+    if not config.getoption("gate"):
+        return
+    smoke = [item for item in items if item.get_closest_marker(SMOKE_MARKER)]
+    others = [item for item in items if not item.get_closest_marker(SMOKE_MARKER)]
+    if others:
+        config.hook.pytest_deselected(items=others)
+
+    priority = detection_priority([item.nodeid for item in smoke], _load_failure_stats(config))
+    smoke.sort(key=lambda item: (bool(item.get_closest_marker(QUARANTINE_MARKER)), -priority[item.nodeid]))
+    items[:] = smoke
+    if not hasattr(config, "workerinput"):
+        log.info(f"[GATE] 실행 순서: {', '.join(item.nodeid for item in smoke)}")
+
+
+class GateGuard:
+    """격리되지 않은 테스트가 최종 실패하면 세션을 즉시 중단하고 게이트 결과를 요약하는 플러그인"""
+
+    def __init__(self, config):
+        """
+        GateGuard 초기화
+
+        Args:
+            config: pytest Config 인스턴스
+        """
+        self.config = config
+        self.session = None
+        self.started = time.monotonic()
+        self.failure = None
+
+    def pytest_sessionstart(self, session):
+        """세션 보관 및 시작 시각 기록"""
+        self.session = session
+        self.started = time.monotonic()
+
+    def pytest_runtest_logreport(self, report):
+        """첫 번째 차단 실패에서 중단 (pytest-xdist controller는 모든 worker 종료 요청)"""
+        if not report.failed or getattr(report, "will_rerun", False) or QUARANTINE_MARKER in report.keywords:
+            return
+        if self.failure is not None:
+            return
+        self.failure = (report.nodeid, time.monotonic() - self.started)
+        reason = f"[GATE] 핵심 스모크 테스트 실패로 게이트 중단: {report.nodeid}"
+        log.error(reason)
+        dsession = self.config.pluginmanager.getplugin("dsession")
+        if dsession is not None:
+            dsession.shouldstop = reason
+        elif self.session is not None:
+            self.session.shouldstop = reason
+
+    def pytest_terminal_summary(self, terminalreporter, exitstatus):
+        """게이트 판정과 판정까지 걸린 시간 출력"""
+        if hasattr(self.config, "workerinput"):
+            return
+        elapsed = time.monotonic() - self.started
+        if self.failure is not None:
+            nodeid, at = self.failure
+            terminalreporter.write_sep("=", f"deploy gate FAILED after {at:.2f}s: {nodeid}", red=True)
+        elif exitstatus == pytest.ExitCode.OK:
+            terminalreporter.write_sep("=", f"deploy gate PASSED in {elapsed:.2f}s", green=True)
+        else:
+            terminalreporter.write_sep("=", f"deploy gate FAILED (exit status {int(exitstatus)})", red=True)
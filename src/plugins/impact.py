@@ -0,0 +1,436 @@
+"""테스트 영향도 기반 선택 플러그인
+
+--impact-record로 실행하면 각 테스트가 호출한 페이지 객체 메서드(src/actions/의 클래스)와
+참조한 로케이터 상수(src/locators/)를 기록하여 Result/impact_map.json에 누적합니다.
+module / session scope fixture가 셋업 중 사용한 메서드/상수는 그 fixture를 요청하는 모든 테스트에 기록합니다.
+--impact-since로 실행하면 git diff에서 변경된 메서드/상수를 찾아 영향을 받는 테스트만 실행합니다.
+
+    pytest --impact-record                  # 의존성 맵 기록 (전체 실행)
+    pytest --impact-since origin/main       # 변경 영향 테스트만 실행
+
+맵에 없는 테스트(새 테스트 등)는 항상 실행하며, 매핑할 수 없는 파일(conftest.py, src/utils/,
+응답 스키마 postman/todolist_api_schema.json 등)이 변경되면 전체를 실행합니다.
+"""
+import ast
+import functools
+import importlib
+import inspect
+import json
+import logging
+import re
+import subprocess
+import types
+from collections import defaultdict
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+from src.plugins.browsers import strip_browser_param
+from src.utils.env_loader import get_project_root
+from src.utils.result_dir import RESULT_ROOT
+
+log = logging.getLogger(__name__)
+
+PROJECT_ROOT = get_project_root()
+IMPACT_MAP_PATH = RESULT_ROOT / "impact_map.json"
+IMPACT_PROPERTY = "impact"
+ACTION_ROOT = "src/actions"
+LOCATOR_ROOT = "src/locators"
+TEST_ROOT = "tests"
+# postman/todolist_api_schema.json은 모든 API 응답 검증에 사용되므로 무시하지 않음 (매핑할 수 없는 변경 → 전체 실행)
+IGNORED_PATHS = ("*.md", "Result/*", "postman/todolist_postman_*.json", ".github/*")
+HUNK_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def pytest_addoption(parser):
+    """영향도 기록 / 선택 옵션 등록"""
+    group = parser.getgroup("impact", "테스트 영향도 기반 선택")
+    group.addoption("--impact-record", action="store_true",
+                    help="테스트별 페이지 객체 메서드 / 로케이터 의존성 기록")
+    group.addoption("--impact-since", metavar="REF",
+                    help="REF 대비 변경(git diff)의 영향을 받는 테스트만 실행")
+    group.addoption("--impact-map", default=str(IMPACT_MAP_PATH),
+                    help=f"의존성 맵 경로 (기본값: {IMPACT_MAP_PATH})")
+
+
+def _source_modules(root):
+    """root 아래 Python 파일의 모듈 이름 목록"""
+    return sorted(
+        ".".join(path.relative_to(PROJECT_ROOT).with_suffix("").parts)
+        for path in (PROJECT_ROOT / root).rglob("*.py")
+        if path.name != "__init__.py"
+    )
+
+
+def load_impact_map(path):
+    """
+    의존성 맵 로드
+
+    브라우저 매트릭스(--browsers)로 기록한 엔진별 항목은 엔진 파라미터를 뺀 nodeid로 합쳐서
+    단일 엔진 실행에서도 같은 테스트로 찾을 수 있게 합니다.
+
+    Args:
+        path: impact_map.json 경로
+
+    Returns:
+        dict[str, list[str]]: 엔진 파라미터를 뺀 nodeid별 의존 심볼 목록
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            recorded = json.load(f).get("tests", {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+    tests = {}
+    for nodeid, symbols in recorded.items():
+        key = strip_browser_param(nodeid)
+        tests[key] = sorted(set(tests.get(key, ())) | set(symbols))
+    return tests
+
+
+class _LocatorProxy(types.ModuleType):
+    """로케이터 모듈 속성 접근을 기록하는 프록시 모듈"""
+
+    def __init__(self, module, recorder):
+        super().__init__(module.__name__, module.__doc__)
+        self._module = module
+        self._recorder = recorder
+        self._prefix = module.__name__.rsplit(".", 1)[-1]
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if name.isupper():
+            self._recorder.current.add(f"{self._prefix}.{name}")
+        return value
+
+
+class ImpactRecorder:
+    """테스트 실행 중 페이지 객체 메서드 호출과 로케이터 참조를 기록하는 플러그인"""
+
+    def __init__(self, map_path):
+        """
+        ImpactRecorder 초기화
+
+        Args:
+            map_path: 기록할 impact_map.json 경로
+        """
+        self.map_path = map_path
+        self.current = set()
+        self.recorded = {}
+        self.fixture_usage = defaultdict(set)
+        self._locator_modules = {}
+        self._restore = []
+
+    def install(self):
+        """페이지 객체 메서드 래핑 및 로케이터 모듈 프록시 설치"""
+        for module_name in _source_modules(LOCATOR_ROOT):
+            module = importlib.import_module(module_name)
+            self._locator_modules[id(module)] = _LocatorProxy(module, self)
+
+        for module_name in _source_modules(ACTION_ROOT):
+            module = importlib.import_module(module_name)
+            self._patch_locator_refs(module)
+            for cls in vars(module).values():
+                if inspect.isclass(cls) and cls.__module__ == module_name:
+                    self._wrap_methods(cls)
+
+    def uninstall(self):
+        """설치한 래퍼와 프록시 제거"""
+        for owner, name, original in reversed(self._restore):
+            setattr(owner, name, original)
+        self._restore.clear()
+
+    def _patch_locator_refs(self, module):
+        """모듈 전역에서 참조하는 로케이터 모듈을 프록시로 교체"""
+        for name, value in list(vars(module).items()):
+            proxy = self._locator_modules.get(id(value)) if isinstance(value, types.ModuleType) else None
+            if proxy is not None:
+                self._restore.append((module, name, value))
+                setattr(module, name, proxy)
+
+    def _wrap_methods(self, cls):
+        for name, func in list(vars(cls).items()):
+            if not inspect.isfunction(func) or (name.startswith("__") and name != "__init__"):
+                continue
+            self._restore.append((cls, name, func))
+            setattr(cls, name, self._recording(func, f"{cls.__name__}.{name}"))
+
+    def _recording(self, func, symbol):
+        current = self.current
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            current.add(symbol)
+            return func(*args, **kwargs)
+        return wrapper
+
+    def pytest_collection_modifyitems(self, items):
+        """테스트 모듈에서 직접 참조하는 로케이터 모듈도 프록시로 교체"""
+        for module in {item.module for item in items if getattr(item, "module", None)}:
+            self._patch_locator_refs(module)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """테스트 시작 시 기록 초기화"""
+        self.current.clear()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """
+        module / session scope fixture가 셋업 중 사용한 심볼을 fixture별로 기록
+
+        scope가 넓은 fixture는 처음 요청한 테스트의 셋업에서 한 번만 실행되므로,
+        기록해 두었다가 그 fixture를 요청하는 모든 테스트에 합칩니다.
+        """
+        if fixturedef.scope == "function":
+            return (yield)
+        outer = set(self.current)
+        self.current.clear()
+        try:
+            return (yield)
+        finally:
+            self.fixture_usage[fixturedef] |= self.current
+            self.current |= outer
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """teardown 리포트에 테스트와 테스트가 요청한 module / session scope fixture가 사용한 심볼 첨부"""
+        report = yield
+        if call.when == "teardown":
+            for fixturedefs in item._fixtureinfo.name2fixturedefs.values():
+                for fixturedef in fixturedefs:
+                    self.current.update(self.fixture_usage.get(fixturedef, ()))
+            report.user_properties.append((IMPACT_PROPERTY, sorted(self.current)))
+            self.current.clear()
+        return report
+
+    def pytest_runtest_logreport(self, report):
+        """최종 시도의 심볼 목록 수집 (xdist 사용 시 controller에서 수집, 엔진별 기록은 합침)"""
+        if report.when != "teardown" or getattr(report, "will_rerun", False):
+            return
+        key = strip_browser_param(report.nodeid)
+        for name, value in report.user_properties:
+            if name == IMPACT_PROPERTY:
+                self.recorded[key] = sorted(set(self.recorded.get(key, ())) | set(value))
+
+    def pytest_sessionfinish(self, session):
+        """기존 맵에 이번 실행의 기록을 병합하여 저장"""
+        self.uninstall()
+        if hasattr(session.config, "workerinput") or not self.recorded:
+            return
+        tests = load_impact_map(self.map_path)
+        tests.update(self.recorded)
+        self.map_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.map_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "tests": tests}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        log.info(f"[IMPACT] 의존성 맵 저장: {self.map_path} ({len(self.recorded)}건 갱신)")
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def parse_diff(diff_text):
+    """
+    unified diff에서 파일별 변경 라인 범위 추출
+
+    Args:
+        diff_text: git diff --unified=0 출력
+
+    Returns:
+        dict[str, dict]: 파일 경로별 {"old_path", "old": [(start, end)], "new": [(start, end)]}
+    """
+    changes = {}
+    current = None
+    old_path = None
+    for line in diff_text.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line[4:] == "/dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            new_path = line[6:] if line[4:] != "/dev/null" else old_path
+            current = changes.setdefault(new_path, {"old_path": old_path, "old": [], "new": []})
+        elif current is not None and line.startswith("@@"):
+            match = HUNK_PATTERN.match(line)
+            if not match:
+                continue
+            old_start, old_len, new_start, new_len = match.groups()
+            old_len = 1 if old_len is None else int(old_len)
+            new_len = 1 if new_len is None else int(new_len)
+            if old_len:
+                current["old"].append((int(old_start), int(old_start) + old_len - 1))
+            if new_len:
+                current["new"].append((int(new_start), int(new_start) + new_len - 1))
+    return changes
+
+
+def _overlaps(node, ranges):
+    end = getattr(node, "end_lineno", node.lineno)
+    start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return any(start <= r_end and r_start <= end for r_start, r_end in ranges)
+
+
+def _action_symbols(tree, ranges):
+    """액션 모듈에서 변경 범위에 걸친 Class.method 심볼 추출"""
+    symbols = set()
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    for cls in classes:
+        if not _overlaps(cls, ranges):
+            continue
+        header_start = min([cls.lineno] + [d.lineno for d in cls.decorator_list])
+        header = (header_start, cls.body[0].lineno - 1)
+        header_changed = any(header[0] <= r_end and r_start <= header[1] for r_start, r_end in ranges)
+        for node in cls.body:
+            if not _overlaps(node, ranges):
+                continue
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols.add(f"{cls.name}.{node.name}")
+            else:
+                header_changed = True
+        if header_changed:
+            symbols.add(f"{cls.name}.*")
+
+    # 모듈 수준 변경(import, 상수 등)은 모듈에 정의된 모든 클래스에 영향
+    if any(not isinstance(node, ast.ClassDef) and _overlaps(node, ranges) for node in tree.body):
+        symbols.update(f"{cls.name}.*" for cls in classes)
+    return symbols
+
+
+def _locator_symbols(tree, ranges, prefix):
+    """로케이터 모듈에서 변경 범위에 걸친 상수와 그 상수를 참조하는 별칭 추출"""
+    aliases = {}
+    changed = set()
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        refs = {n.id for n in ast.walk(node.value) if isinstance(n, ast.Name)}
+        for name in names:
+            aliases[name] = refs
+            if _overlaps(node, ranges):
+                changed.add(name)
+
+    grown = True
+    while grown:
+        extra = {name for name, refs in aliases.items() if refs & changed} - changed
+        changed |= extra
+        grown = bool(extra)
+    return {f"{prefix}.{name}" for name in changed}
+
+
+def changed_symbols(path, source, ranges):
+    """
+    변경된 파일 내용과 라인 범위로부터 영향 심볼 계산
+
+    Args:
+        path: 프로젝트 루트 기준 파일 경로
+        source: 파일 내용
+        ranges: 변경 라인 범위 목록
+
+    Returns:
+        set[str] | None: 영향 심볼 집합, 매핑할 수 없는 파일이면 None
+    """
+    if not ranges or source is None:
+        return set()
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    if path.startswith(f"{ACTION_ROOT}/"):
+        return _action_symbols(tree, ranges)
+    if path.startswith(f"{LOCATOR_ROOT}/"):
+        return _locator_symbols(tree, ranges, path.rsplit("/", 1)[-1][:-3])
+    return None
+
+
+def _read_revision(ref, path):
+    try:
+        return _git("show", f"{ref}:{path}")
+    except subprocess.CalledProcessError:
+        return None
+
+
+def _read_worktree(path):
+    try:
+        return (PROJECT_ROOT / path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def analyze_diff(ref):
+    """
+    REF 대비 작업 트리 변경 분석
+
+    Args:
+        ref: 비교할 git 리비전
+
+    Returns:
+        tuple[set[str], set[str], list[str]]: (영향 심볼, 변경된 테스트 파일, 매핑할 수 없는 파일)
+    """
+    changes = parse_diff(_git("diff", "--unified=0", "--no-color", ref, "--"))
+    untracked = _git("ls-files", "--others", "--exclude-standard").splitlines()
+    for path in untracked:
+        if path.endswith(".py"):
+            changes.setdefault(path, {"old_path": None, "old": [], "new": [(1, 10 ** 9)]})
+
+    symbols, test_files, unmapped = set(), set(), []
+    for path, change in changes.items():
+        if any(fnmatch(path, pattern) for pattern in IGNORED_PATHS):
+            continue
+        if path.startswith(f"{TEST_ROOT}/") and path.endswith(".py") and path.rsplit("/", 1)[-1].startswith("test_"):
+            test_files.add(path)
+            continue
+        new = changed_symbols(path, _read_worktree(path), change["new"]) if path.endswith(".py") else None
+        old = (changed_symbols(change["old_path"], _read_revision(ref, change["old_path"]), change["old"])
+               if change["old_path"] and path.endswith(".py") else set())
+        if new is None or old is None:
+            unmapped.append(path)
+            continue
+        symbols |= new | old
+    return symbols, test_files, unmapped
+
+
+def _affected(dependencies, symbols):
+    for dependency in dependencies:
+        if dependency in symbols or f"{dependency.split('.', 1)[0]}.*" in symbols:
+            return True
+    return False
+
+
+def pytest_configure(config):
+    """--impact-record 사용 시 기록 플러그인 설치"""
+    if config.getoption("impact_record"):
+        recorder = ImpactRecorder(Path(config.getoption("impact_map")))
+        recorder.install()
+        config.pluginmanager.register(recorder, "impact_recorder")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """--impact-since 사용 시 변경 영향을 받는 테스트만 선택"""
+    ref = config.getoption("impact_since")
+    if not ref:
+        return
+
+    try:
+        symbols, test_files, unmapped = analyze_diff(ref)
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.warning(f"[IMPACT] git diff 분석 실패로 전체 테스트를 실행합니다: {e}")
+        return
+    if unmapped:
+        log.info(f"[IMPACT] 매핑할 수 없는 변경으로 전체 테스트를 실행합니다: {', '.join(sorted(unmapped))}")
+        return
+
+    impact_map = load_impact_map(config.getoption("impact_map"))
+    selected, deselected = [], []
+    for item in items:
+        dependencies = impact_map.get(strip_browser_param(item.nodeid))
+        if (dependencies is None or item.nodeid.split("::", 1)[0] in test_files
+                or _affected(dependencies, symbols)):
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    log.info(f"[IMPACT] 변경 심볼 {len(symbols)}개 → {len(selected)}개 테스트 선택, {len(deselected)}개 제외")
+    if deselected:
+        items[:] = selected
+        config.hook.pytest_deselected(items=deselected)
@@ -0,0 +1,159 @@
+"""테스트별 Python 프로파일링 플러그인
+
+--profile(또는 PROFILE 환경 변수)로 실행하면 테스트마다 setup부터 teardown까지 Python 실행을 프로파일링하여
+느린 테스트의 시간이 Python 코드(route 핸들러, 로그 포맷팅, dialog 핸들러 등)에 쓰이는지
+I/O 대기(Playwright / 백엔드 응답)에 쓰이는지 확인합니다.
+
+- sample: 저부하 샘플링 프로파일러, Result/<timestamp>/profiles/<test>.folded (flamegraph.pl / speedscope)
+- cprofile: cProfile 결정적 프로파일러, Result/<timestamp>/profiles/<test>.prof (snakeviz / flameprof)
+- --profile-threshold 이상 걸린 테스트만 결과를 저장하고, hotspot 상위 목록을 results.jsonl의
+  properties.profile에 기록하며 전체 hotspot을 터미널 요약에 출력합니다.
+
+    pytest --profile sample --profile-threshold 2
+    pytest tests/test_web.py::test_add_todo --profile cprofile
+"""
+import logging
+import os
+import re
+import time
+from collections import defaultdict
+
+import pytest
+
+from src.plugins.result_stream import ARTIFACT_PROPERTY
+from src.utils.result_dir import get_run_dir
+
+log = logging.getLogger(__name__)
+
+PROFILE_PROPERTY = "profile"
+PROFILES_DIR = "profiles"
+PROFILE_SUFFIXES = {"sample": ".folded", "cprofile": ".prof"}
+
+
+def pytest_addoption(parser):
+    """프로파일링 옵션 등록"""
+    group = parser.getgroup("profiling", "Python 프로파일링")
+    group.addoption("--profile", choices=tuple(PROFILE_SUFFIXES), default=os.getenv("PROFILE") or None,
+                    help="테스트별 Python 프로파일링 방식: sample(저부하 샘플링), cprofile(결정적) (기본값: 사용 안 함)")
+    group.addoption("--profile-threshold", type=float, default=0.0,
+                    help="프로파일 결과를 저장할 최소 테스트 실행 시간(초) (기본값: 0, 전체 저장)")
+    group.addoption("--profile-interval", type=float, default=5.0,
+                    help="sample 방식의 샘플링 주기(ms) (기본값: 5)")
+    group.addoption("--profile-top", type=int, default=10,
+                    help="테스트별 / 전체 hotspot 출력 개수 (기본값: 10)")
+
+
+def pytest_configure(config):
+    """테스트를 실행하는 프로세스에는 프로파일러를, 결과를 기록하는 프로세스에는 요약 플러그인 등록"""
+    mode = config.getoption("profile")
+    if not mode:
+        return
+    from src.utils.profiler import CProfiler, StackSampler
+
+    top = config.getoption("profile_top")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(HotspotSummary(top), "hotspot_summary")
+    if not hasattr(config, "workerinput") and config.getoption("dist", "no") != "no":
+        return
+    profiler = StackSampler(config.getoption("profile_interval") / 1000) if mode == "sample" else CProfiler()
+    config.pluginmanager.register(
+        ProfileRecorder(mode, profiler, config.getoption("profile_threshold"), top), "test_profiler")
+
+
+class ProfileRecorder:
+    """테스트 시도(setup ~ teardown)마다 프로파일링하여 결과 파일과 hotspot을 리포트에 첨부하는 플러그인"""
+
+    def __init__(self, mode, profiler, threshold, top):
+        """
+        ProfileRecorder 초기화
+
+        Args:
+            mode: sample / cprofile
+            profiler: StackSampler 또는 CProfiler
+            threshold: 결과를 저장할 최소 실행 시간(초)
+            top: 리포트에 첨부할 hotspot 개수
+        """
+        self.mode = mode
+        self.profiler = profiler
+        self.threshold = threshold
+        self.top = top
+        self._started = None
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """setup 시작 시 프로파일링 시작 (재실행 시도마다 새로 시작)"""
+        self._started = time.perf_counter()
+        self.profiler.start()
+        return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """teardown 종료 시 프로파일링을 멈추고 기준 시간 이상이면 결과 저장 및 hotspot 첨부"""
+        report = yield
+        if call.when != "teardown" or self._started is None:
+            return report
+        self.profiler.stop()
+        duration = time.perf_counter() - self._started
+        self._started = None
+        if duration < self.threshold:
+            return report
+
+        path = get_run_dir(item.config) / PROFILES_DIR / (
+            re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_") + PROFILE_SUFFIXES[self.mode])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.profiler.save(path)
+        report.user_properties.append((ARTIFACT_PROPERTY, str(path)))
+        report.user_properties.append((PROFILE_PROPERTY, {
+            "mode": self.mode,
+            "duration_s": round(duration, 3),
+            "wait_ratio": self.profiler.wait_ratio(),
+            "hotspots": self.profiler.hotspots(self.top),
+        }))
+        log.debug(f"[PROFILE] {item.nodeid} 프로파일 저장: {path}")
+        return report
+
+
+class HotspotSummary:
+    """프로파일링한 테스트와 전체 hotspot(self 시간 합계)을 터미널 요약에 출력하는 플러그인"""
+
+    def __init__(self, top):
+        """
+        HotspotSummary 초기화
+
+        Args:
+            top: 출력할 hotspot 개수
+        """
+        self.top = top
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        """teardown 리포트의 프로파일 요약 수집 (재실행 시도는 마지막 시도 값으로 덮어씀)"""
+        if report.when == "teardown":
+            profile = dict(report.user_properties).get(PROFILE_PROPERTY)
+            if profile:
+                self.tests[report.nodeid] = profile
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """느린 프로파일 테스트와 전체 hotspot 출력"""
+        if not self.tests:
+            return
+        self_ms = defaultdict(float)
+        wait = {}
+        for profile in self.tests.values():
+            for hotspot in profile["hotspots"]:
+                self_ms[hotspot["function"]] += hotspot["self_ms"]
+                wait[hotspot["function"]] = hotspot.get("wait", False)
+        total_ms = sum(profile["duration_s"] for profile in self.tests.values()) * 1000
+
+        terminalreporter.write_sep("-", f"python hotspots ({len(self.tests)} profiled tests)")
+        terminalreporter.write_line(f"{'self_ms':>10}{'share':>8}  function")
+        for function, ms in sorted(self_ms.items(), key=lambda entry: entry[1], reverse=True)[:self.top]:
+            terminalreporter.write_line(
+                f"{ms:>10.1f}{ms / max(total_ms, 1.0):>8.1%}  {function}{'  (I/O wait)' if wait[function] else ''}")
+
+        terminalreporter.write_line(f"{'duration_s':>10}{'wait':>8}  nodeid")
+        ranked = sorted(self.tests.items(), key=lambda entry: entry[1]["duration_s"], reverse=True)
+        for nodeid, profile in ranked[:self.top]:
+            ratio = profile["wait_ratio"]
+            terminalreporter.write_line(
+                f"{profile['duration_s']:>10.2f}{'-' if ratio is None else f'{ratio:.0%}':>8}  {nodeid}")
@@ -0,0 +1,265 @@
+"""테스트 실행 리소스(CPU / 메모리) 사용량 기록 플러그인
+
+--resource-profile(또는 RESOURCE_PROFILE=true)로 실행하면 세션 동안 백그라운드 스레드가
+pytest 프로세스와 모든 하위 프로세스(Playwright 드라이버, Chromium / Firefox / WebKit 프로세스)의
+CPU 사용률과 RSS를 주기적으로 측정합니다.
+
+- 측정값은 실행 중인 테스트와 함께 Result/<timestamp>/resources.jsonl에 시간순으로 기록됩니다
+  (pytest-xdist worker는 resources_<worker>.jsonl).
+- 테스트별 최대 RSS / 평균 CPU / 브라우저 프로세스 수는 results.jsonl의 properties.resources에 기록되고
+  HTML 리포트와 터미널 요약에 표시됩니다.
+- 기준 시점 대비 전체 RSS 증가가 --resource-leak-mb를 넘거나 테스트 종료 후 브라우저 프로세스가 늘어난 채
+  남아 있으면 누수 의심으로 경고합니다. 기준 시점은 첫 테스트 종료 시점이며, 브라우저 풀에 새 엔진이
+  실행된 테스트와 누수 경고를 낸 테스트의 종료 시점으로 갱신됩니다.
+
+psutil이 필요하며 이 옵션을 사용할 때만 import합니다.
+
+    pytest --resource-profile --resource-interval 0.2 --resource-leak-mb 200
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from src.plugins.browsers import get_item_browser
+from src.utils.result_dir import get_run_dir
+
+log = logging.getLogger(__name__)
+
+RESOURCES_PROPERTY = "resources"
+RESOURCES_FILE = "resources.jsonl"
+BROWSER_PROCESS_NAMES = ("chrom", "headless_shell", "firefox", "webkit", "minibrowser")
+SUMMARY_LIMIT = 10
+MB = 1024 * 1024
+
+
+def pytest_addoption(parser):
+    """리소스 기록 옵션 등록"""
+    group = parser.getgroup("resources", "리소스 사용량 기록")
+    group.addoption("--resource-profile", action="store_true",
+                    default=os.getenv("RESOURCE_PROFILE", "false").lower() == "true",
+                    help="pytest / 브라우저 프로세스의 CPU / RSS 사용량 기록 (psutil 필요)")
+    group.addoption("--resource-interval", type=float, default=0.5,
+                    help="측정 주기(초) (기본값: 0.5)")
+    group.addoption("--resource-leak-mb", type=float, default=float(os.getenv("RESOURCE_LEAK_MB", "300")),
+                    help="기준 시점 대비 전체 RSS 증가 누수 경고 기준(MB) (기본값: 300)")
+
+
+def pytest_configure(config):
+    """테스트를 실행하는 프로세스에는 측정기를, 결과를 기록하는 프로세스에는 요약 플러그인 등록"""
+    if not config.getoption("resource_profile"):
+        return
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        config.pluginmanager.register(ResourceSummary(), "resource_summary")
+    if workerinput is None and config.getoption("dist", "no") != "no":
+        return
+    try:
+        import psutil
+    except ImportError:
+        raise pytest.UsageError("--resource-profile에는 psutil이 필요합니다: pip install psutil")
+
+    name = f"resources_{workerinput['workerid']}.jsonl" if workerinput else RESOURCES_FILE
+    sampler = ResourceSampler(psutil, name, config.getoption("resource_interval"), config.getoption("resource_leak_mb"))
+    config.pluginmanager.register(sampler, "resource_sampler")
+
+
+def _is_browser(name):
+    name = name.lower()
+    return any(keyword in name for keyword in BROWSER_PROCESS_NAMES)
+
+
+class ResourceSampler:
+    """
+    백그라운드 스레드로 프로세스 트리의 CPU / RSS를 측정하고 테스트별 최대값을 리포트에 첨부하는 플러그인
+
+    테스트 시작 / 종료 시점에도 한 번씩 측정하여 측정 주기보다 짧은 테스트도 값이 남도록 합니다.
+    """
+
+    def __init__(self, psutil, file_name, interval, leak_mb):
+        """
+        ResourceSampler 초기화
+
+        Args:
+            psutil: psutil 모듈
+            file_name: 측정값을 기록할 결과 디렉토리 내 JSONL 파일 이름
+            interval: 측정 주기(초)
+            leak_mb: 누수 경고 기준 RSS 증가량(MB)
+        """
+        self.psutil = psutil
+        self.file_name = file_name
+        self.interval = interval
+        self.leak_mb = leak_mb
+        self.process = psutil.Process()
+        self._children = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+        self._started = None
+        self._nodeid = None
+        self._test = None
+        self._baseline = None
+        self._engines = set()
+
+    def _sample(self):
+        """프로세스 트리 측정 후 기록 및 현재 테스트 최대값 갱신 (측정 스레드 / 메인 스레드 공용)"""
+        with self._lock:
+            try:
+                rss = self.process.memory_info().rss
+                cpu = self.process.cpu_percent(None)
+                children = self.process.children(recursive=True)
+            except self.psutil.Error:
+                return None
+            child_rss = browser_rss = 0
+            browsers = 0
+            alive = {}
+            for child in children:
+                # cpu_percent는 같은 Process 객체의 직전 호출 대비 값이므로 객체를 재사용
+                child = self._children.get(child.pid, child)
+                try:
+                    child_mem = child.memory_info().rss
+                    cpu += child.cpu_percent(None)
+                    is_browser = _is_browser(child.name())
+                except self.psutil.Error:
+                    continue
+                alive[child.pid] = child
+                child_rss += child_mem
+                if is_browser:
+                    browsers += 1
+                    browser_rss += child_mem
+            self._children = alive
+
+            sample = {
+                "t": round(time.monotonic() - self._started, 3),
+                "test": self._nodeid,
+                "cpu_percent": round(cpu, 1),
+                "rss_mb": round(rss / MB, 1),
+                "children_rss_mb": round(child_rss / MB, 1),
+                "browser_rss_mb": round(browser_rss / MB, 1),
+                "total_rss_mb": round((rss + child_rss) / MB, 1),
+                "browser_processes": browsers,
+            }
+            self._file.write(json.dumps(sample, ensure_ascii=False) + "\n")
+            if self._test is not None:
+                test = self._test
+                test["samples"] += 1
+                test["cpu_total"] += sample["cpu_percent"]
+                test["peak_rss_mb"] = max(test["peak_rss_mb"], sample["rss_mb"])
+                test["peak_total_rss_mb"] = max(test["peak_total_rss_mb"], sample["total_rss_mb"])
+                test["peak_browser_processes"] = max(test["peak_browser_processes"], sample["browser_processes"])
+            return sample
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+            self._file.flush()
+
+    def pytest_sessionstart(self, session):
+        """측정 파일을 열고 측정 스레드 시작 (테스트를 실행하지 않는 호출이면 측정하지 않음)"""
+        run_dir = get_run_dir(session.config)
+        if run_dir is None:
+            return
+        self._started = time.monotonic()
+        self._file = (run_dir / self.file_name).open("a", encoding="utf-8")
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """실행 중인 테스트를 측정값에 연결"""
+        with self._lock:
+            self._nodeid = item.nodeid
+            self._test = {"samples": 0, "cpu_total": 0.0, "peak_rss_mb": 0.0, "peak_total_rss_mb": 0.0,
+                          "peak_browser_processes": 0}
+        start = self._sample()
+        self._test["start_total_rss_mb"] = start["total_rss_mb"] if start else None
+        try:
+            return (yield)
+        finally:
+            with self._lock:
+                self._nodeid = None
+                self._test = None
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """teardown 리포트에 테스트 동안의 최대 RSS / 평균 CPU / 누수 의심 여부 첨부"""
+        report = yield
+        if call.when != "teardown" or self._test is None:
+            return report
+        end = self._sample()
+        if end is None:
+            return report
+
+        test = self._test
+        engine = get_item_browser(item)
+        warmup = self._baseline is None or (engine is not None and engine not in self._engines)
+        if engine is not None:
+            self._engines.add(engine)
+        baseline = self._baseline or end
+        growth_mb = end["total_rss_mb"] - baseline["total_rss_mb"]
+        extra_browsers = end["browser_processes"] - baseline["browser_processes"]
+        leak = not warmup and (growth_mb > self.leak_mb or extra_browsers > 0)
+        if leak:
+            log.warning(f"[RESOURCE] 누수 의심: {item.nodeid} 종료 후 전체 RSS {end['total_rss_mb']:.0f}MB "
+                        f"(기준 대비 {growth_mb:+.0f}MB, 브라우저 프로세스 {extra_browsers:+d})")
+        if warmup or leak:
+            self._baseline = end
+        report.user_properties.append((RESOURCES_PROPERTY, {
+            "peak_rss_mb": test["peak_rss_mb"],
+            "peak_total_rss_mb": test["peak_total_rss_mb"],
+            "peak_browser_processes": test["peak_browser_processes"],
+            "cpu_avg_percent": round(test["cpu_total"] / test["samples"], 1),
+            "start_total_rss_mb": test["start_total_rss_mb"],
+            "end_total_rss_mb": end["total_rss_mb"],
+            "growth_mb": round(growth_mb, 1),
+            "leak": leak,
+        }))
+        return report
+
+    def pytest_sessionfinish(self, session):
+        """측정 스레드 종료 및 측정 파일 닫기"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        self._file.close()
+        self._thread = None
+
+
+class ResourceSummary:
+    """테스트별 최대 메모리 / 누수 의심 테스트를 터미널 요약에 출력하는 플러그인 (결과를 기록하는 프로세스에 등록)"""
+
+    def __init__(self):
+        """ResourceSummary 초기화"""
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        """teardown 리포트의 리소스 측정값 수집 (재실행 시도는 마지막 시도 값으로 덮어씀)"""
+        if report.when == "teardown":
+            resources = dict(report.user_properties).get(RESOURCES_PROPERTY)
+            if resources:
+                self.tests[report.nodeid] = resources
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """최대 메모리 상위 테스트와 누수 의심 테스트 출력"""
+        if not self.tests:
+            return
+        terminalreporter.write_sep("-", "resource usage")
+        terminalreporter.write_line(
+            f"{'peak_mb':>9}{'pytest_mb':>11}{'browsers':>10}{'cpu%':>7}{'growth_mb':>11}  nodeid")
+        ranked = sorted(self.tests.items(), key=lambda entry: entry[1]["peak_total_rss_mb"], reverse=True)
+        for nodeid, stats in ranked[:SUMMARY_LIMIT]:
+            terminalreporter.write_line(
+                f"{stats['peak_total_rss_mb']:>9.0f}{stats['peak_rss_mb']:>11.0f}{stats['peak_browser_processes']:>10}"
+                f"{stats['cpu_avg_percent']:>7.0f}{stats['growth_mb']:>+11.0f}  {nodeid}")
+        leaks = [nodeid for nodeid, stats in self.tests.items() if stats["leak"]]
+        if leaks:
+            terminalreporter.write_sep("-", f"resource leak suspects ({len(leaks)})", yellow=True)
+            for nodeid in leaks:
+                terminalreporter.write_line(nodeid)
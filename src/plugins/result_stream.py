@@ -0,0 +1,178 @@
+"""테스트 결과 스트리밍 기록 플러그인
+
+테스트가 끝날 때마다 Result/<timestamp>/results.jsonl에 결과 한 줄을 추가합니다.
+실행이 중간에 종료되어도 그때까지의 결과가 남고, 메모리 사용량은 테스트 수와
+무관하게 일정합니다. HTML 리포트는 세션 종료 시 이 스트림으로부터 생성합니다.
+"""
+import json
+import logging
+from datetime import datetime
+
+import pytest
+
+from src.reporting.html_report import RESULTS_FILE, render_html
+from src.utils.result_dir import INDEX_FILE
+from src.utils.timing import drain_api_calls, drain_web_timings
+
+log = logging.getLogger(__name__)
+
+API_CALLS_PROPERTY = "api_calls"
+WEB_TIMINGS_PROPERTY = "web_timings"
+ARTIFACT_PROPERTY = "artifact"
+LONGREPR_LIMIT = 4000
+SESSION_PROPERTIES_KEY = pytest.StashKey()
+
+
+def _now():
+    return datetime.now().isoformat(timespec="milliseconds")
+
+
+def _phase_outcome(report):
+    """
+    단계별 리포트를 결과 문자열로 변환
+
+    Args:
+        report: pytest TestReport
+
+    Returns:
+        str: passed / failed / error / skipped / xfailed / xpassed
+    """
+    if hasattr(report, "wasxfail"):
+        return "xpassed" if report.passed else "xfailed"
+    if report.failed:
+        return "failed" if report.when == "call" else "error"
+    return report.outcome
+
+
+class TimingCollector:
+    """
+    테스트 동안 기록된 API 호출 / Web 동작 시간을 teardown 리포트에 첨부하는 pytest 플러그인
+
+    테스트를 실행하는 프로세스(pytest-xdist worker 포함)마다 등록되며,
+    첨부된 값은 리포트와 함께 결과를 기록하는 프로세스로 전달됩니다.
+    """
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """teardown 리포트에 테스트 동안 기록된 API 호출 / Web 동작 시간 첨부"""
+        report = yield
+        if call.when == "teardown":
+            report.user_properties.append((API_CALLS_PROPERTY, drain_api_calls()))
+            report.user_properties.append((WEB_TIMINGS_PROPERTY, drain_web_timings()))
+        return report
+
+
+class ResultStream:
+    """
+    테스트 결과를 JSONL 파일에 한 줄씩 추가하는 pytest 플러그인
+
+    pytest-xdist 실행 시에는 controller 프로세스에만 등록되어 모든 worker의 결과를 기록합니다.
+    """
+
+    def __init__(self, run_dir):
+        """
+        ResultStream 초기화
+
+        Args:
+            run_dir: 결과를 기록할 Result/<timestamp>/ 디렉토리
+        """
+        self.run_dir = run_dir
+        self.path = run_dir / RESULTS_FILE
+        self.html_path = run_dir / f"report_{run_dir.name}.html"
+        self._file = None
+        self._pending = {}
+        self._started = None
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def pytest_sessionstart(self, session):
+        """
+        결과 파일을 열고 세션 시작 레코드 기록
+
+        다른 플러그인이 config.stash[SESSION_PROPERTIES_KEY]에 넣어 둔 값(chaos 시나리오 등)을 함께 기록합니다.
+        """
+        self._started = datetime.now()
+        self._file = self.path.open("a", encoding="utf-8")
+        self._write({
+            "type": "session",
+            "run_id": self.run_dir.name,
+            "started_at": _now(),
+            **session.config.stash.get(SESSION_PROPERTIES_KEY, {}),
+        })
+
+    def pytest_runtest_logreport(self, report):
+        """
+        단계별 결과를 누적하고 teardown 시점에 한 줄로 기록
+
+        재실행 예정인 시도(will_rerun)는 기록하지 않고 마지막 시도만 attempts와 함께 기록합니다.
+        """
+        record = self._pending.setdefault(report.nodeid, {
+            "type": "test",
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "phases": {},
+        })
+        record["phases"][report.when] = round(report.duration, 4)
+
+        if report.when in ("setup", "call"):
+            record["outcome"] = _phase_outcome(report)
+        elif report.failed and record["outcome"] in ("passed", "xpassed"):
+            record["outcome"] = "error"
+        if report.failed:
+            record["longrepr"] = report.longreprtext[-LONGREPR_LIMIT:]
+
+        if report.when != "teardown":
+            return
+
+        self._pending.pop(report.nodeid)
+        if getattr(report, "will_rerun", False):
+            return
+        record["attempts"] = getattr(report, "attempt", 1)
+        record["duration"] = round(sum(record["phases"].values()), 4)
+        record["finished_at"] = _now()
+        record["api_calls"] = []
+        record["web_timings"] = []
+        record["artifacts"] = []
+        record["properties"] = {}
+        for name, value in report.user_properties:
+            if name == API_CALLS_PROPERTY:
+                record["api_calls"].extend(value)
+            elif name == WEB_TIMINGS_PROPERTY:
+                record["web_timings"].extend(value)
+            elif name == ARTIFACT_PROPERTY:
+                record["artifacts"].append(value)
+            else:
+                record["properties"][name] = value
+        self._write(record)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        """세션 종료 레코드 기록 후 스트림으로부터 HTML 리포트 생성 및 실행 이력 인덱스 적재"""
+        if self._file is None:
+            return
+        self._write({
+            "type": "session_finish",
+            "exitstatus": int(exitstatus),
+            "finished_at": _now(),
+            "duration": round((datetime.now() - self._started).total_seconds(), 3),
+        })
+        self._file.close()
+        self._file = None
+        render_html(self.path, self.html_path)
+        # sqlite3 / 실행 이력 인덱스는 세션 종료 시에만 필요하므로 시작 시간에 포함하지 않음
+        import sqlite3
+
+        from src.reporting.run_index import RunIndex
+
+        try:
+            with RunIndex(self.run_dir.parent / INDEX_FILE) as index:
+                index.ingest_run(self.run_dir)
+        except sqlite3.Error as e:
+            log.warning(f"[INDEX] 실행 이력 인덱스 적재 실패: {e}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """생성된 결과 파일 경로 출력"""
+        terminalreporter.write_sep("-", f"Result stream: {self.path}")
+        if self.html_path.exists():
+            terminalreporter.write_sep("-", f"Generated html report: {self.html_path.as_uri()}")
@@ -0,0 +1,84 @@
+"""실행 이력 기반 pytest-xdist 스케줄링 플러그인
+
+pytest -n N 실행 시 xdist 기본 분배(load) 대신 예상 실행 시간이 긴 작업부터 먼저 쉬는 worker에
+배정(LPT, Longest Processing Time first)하여 전체 실행 시간(makespan)을 줄입니다.
+
+- 예상 실행 시간은 실행 이력 인덱스(Result/index.sqlite)의 최근 평균을 사용합니다.
+- module / session scope 파라미터 fixture를 쓰는 모듈(tests/test_scaling.py 등)은 한 작업 단위로 묶어
+  같은 worker에서 실행합니다.
+- Web 테스트는 모두 같은 JWT 저장 상태로 컨텍스트를 만들므로 브라우저 엔진을 비용이 큰 공통 셋업으로 보고,
+  worker가 이미 실행한 엔진의 작업을 우선 배정합니다(affinity). 다만 그 작업이 남은 가장 긴 작업보다
+  크게 짧으면 LPT를 우선합니다.
+
+    pytest -n 4                      # 기본값: --schedule duration
+    pytest -n 4 --schedule xdist     # xdist 기본 분배 사용
+"""
+import json
+import logging
+
+import pytest
+
+from src.plugins.browsers import estimate_durations, get_item_browser, has_scoped_params, load_durations
+from src.utils.result_dir import get_run_dir
+
+log = logging.getLogger(__name__)
+
+PLAN_FILE = "schedule_plan.json"
+PLAN_WORKER = "gw0"
+
+
+def pytest_addoption(parser):
+    """스케줄링 옵션 등록"""
+    group = parser.getgroup("scheduler", "병렬 실행 스케줄링")
+    group.addoption("--schedule", choices=("duration", "xdist"), default="duration",
+                    help="pytest -n 실행 시 작업 분배 방식: duration(실행 이력 기반 LPT + 엔진 affinity), "
+                         "xdist(기본 분배) (기본값: duration)")
+
+
+def _is_enabled(config):
+    """xdist 기본 분배(--dist load) 실행에서만 스케줄러 사용 (--dist를 직접 지정하면 그대로 따름)"""
+    return config.getoption("schedule") == "duration" and config.getoption("dist", "no") == "load"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """worker에 스케줄 계획 파일 경로 전달"""
+    if _is_enabled(node.config):
+        node.workerinput["schedule_plan"] = str(get_run_dir(node.config) / PLAN_FILE)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    worker 한 곳에서 테스트별 작업 단위 / affinity / 예상 실행 시간을 계산하여 계획 파일로 기록
+
+    controller는 테스트를 수집하지 않아 fixture 정보를 알 수 없으므로,
+    선택이 끝난 최종 테스트 목록 기준으로 worker가 계산한 계획을 사용합니다.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if not workerinput or "schedule_plan" not in workerinput or workerinput["workerid"] != PLAN_WORKER:
+        return
+    estimates = estimate_durations([item.nodeid for item in items], load_durations(config))
+    plan = {
+        item.nodeid: {
+            "unit": item.nodeid.split("::", 1)[0] if has_scoped_params(item) else item.nodeid,
+            "affinity": get_item_browser(item),
+            "duration": round(estimates[item.nodeid], 4),
+        }
+        for item in items
+    }
+    with open(workerinput["schedule_plan"], "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """--schedule duration이면 실행 이력 기반 스케줄러 사용"""
+    if not _is_enabled(config):
+        return None
+    # xdist.scheduler는 import 비용이 커서 병렬 실행에서만 로드
+    from src.utils.scheduling import DurationScheduling
+
+    scheduler = DurationScheduling(config, log, get_run_dir(config) / PLAN_FILE)
+    config.pluginmanager.register(scheduler, "duration_scheduler")
+    return scheduler
@@ -0,0 +1,220 @@
+"""Web(Playwright) 테스트 전용 pytest 플러그인
+
+Playwright import 비용과 프론트엔드 헬스 체크를 Web 테스트가 수집될 때만 지불하도록
+conftest.py에서 분리한 플러그인입니다. Web 테스트 모듈에서 다음과 같이 활성화합니다.
+
+    pytest_plugins = ["src.plugins.web"]
+
+브라우저는 프로세스(pytest-xdist worker)마다 엔진별로 한 번만 실행하여 재사용하고,
+테스트마다 새 컨텍스트를 만들어 격리합니다. 엔진 선택은 src/plugins/browsers.py를 참고하세요.
+"""
+import logging
+import os
+import re
+import tempfile
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import sync_playwright
+
+from src.plugins.browsers import DEFAULT_BROWSER
+from src.plugins.result_stream import ARTIFACT_PROPERTY
+from src.utils.chaos import route_chaos
+from src.utils.health_check import check_health, is_health_check_skipped
+from src.utils.jwt import setup_page_with_token
+from src.utils.result_dir import get_run_dir
+
+log = logging.getLogger(__name__)
+
+WEB_FIXTURE = "web_page"
+ARTIFACTS_DIR = "artifacts"
+DEFAULT_ARTIFACTS = "trace,screenshot"
+PHASE_REPORT_KEY = pytest.StashKey()
+
+
+def get_artifact_kinds():
+    """
+    실패 시 저장할 아티팩트 종류 반환
+
+    WEB_ARTIFACTS 환경 변수(쉼표 구분: trace, screenshot, video)로 설정하며
+    off 또는 빈 값이면 아티팩트를 수집하지 않습니다.
+    video는 모든 컨텍스트의 화면을 인코딩하여 테스트마다 비용이 들기 때문에 기본값에서 제외하고,
+    필요할 때만 WEB_ARTIFACTS=trace,screenshot,video처럼 명시해 사용합니다.
+
+    Returns:
+        set[str]: 저장할 아티팩트 종류
+    """
+    value = os.getenv("WEB_ARTIFACTS", DEFAULT_ARTIFACTS).strip().lower()
+    if value in ("", "off", "none", "false"):
+        return set()
+    return {kind.strip() for kind in value.split(",") if kind.strip()}
+
+
+def _test_failed(item):
+    """setup 또는 call 단계가 실패했는지 확인"""
+    reports = item.stash.get(PHASE_REPORT_KEY, {})
+    return any(report.failed for report in reports.values())
+
+
+def _artifact_dir(item):
+    """테스트별 아티팩트 저장 경로 생성"""
+    safe_name = re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_")
+    path = get_run_dir(item.config) / ARTIFACTS_DIR / safe_name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """fixture teardown에서 테스트 실패 여부를 알 수 있도록 단계별 리포트 보관"""
+    report = yield
+    item.stash.setdefault(PHASE_REPORT_KEY, {})[report.when] = report
+    return report
+
+
+def pytest_collection_finish(session):
+    """Web 테스트가 실제로 선택된 경우에만 프론트엔드 헬스 체크 수행"""
+    if not any(WEB_FIXTURE in getattr(item, "fixturenames", ()) for item in session.items):
+        return
+
+    if is_health_check_skipped():
+        log.warning("[HEALTH] SKIP_HEALTH_CHECK=true 설정으로 프론트엔드 헬스 체크를 건너뜁니다")
+        return
+
+    if not check_health(os.getenv("WEB_BASE_URL"), expect_json=False):
+        msg = "[HEALTH] 프론트엔드 헬스 체크 실패로 테스트를 중단합니다"
+        log.error(msg)
+        pytest.exit(msg, returncode=1)
+
+
+class BrowserPool:
+    """엔진별 브라우저를 처음 요청될 때 실행하고 세션 동안 재사용하는 브라우저 풀"""
+
+    def __init__(self, playwright):
+        """
+        BrowserPool 초기화
+
+        Args:
+            playwright: sync_playwright()로 시작한 Playwright 인스턴스
+        """
+        self.playwright = playwright
+        self.browsers = {}
+
+    def get(self, engine):
+        """
+        엔진별 브라우저 반환 (없거나 연결이 끊겼으면 새로 실행)
+
+        Args:
+            engine: chromium / firefox / webkit
+
+        Returns:
+            Browser: Playwright Browser 인스턴스
+        """
+        browser = self.browsers.get(engine)
+        if browser is None or not browser.is_connected():
+            log.info(f"[BROWSER] {engine} 실행")
+            browser = getattr(self.playwright, engine).launch(
+                headless=os.getenv("HEADLESS", "true").lower() == "true")
+            self.browsers[engine] = browser
+        return browser
+
+    def close(self):
+        """실행한 브라우저 모두 종료"""
+        for browser in self.browsers.values():
+            if browser.is_connected():
+                browser.close()
+        self.browsers.clear()
+
+
+@pytest.fixture(scope="session")
+def browser_pool():
+    """
+    프로세스 단위 브라우저 풀 fixture
+
+    Yields:
+        BrowserPool: 엔진별 브라우저 풀
+    """
+    with sync_playwright() as p:
+        pool = BrowserPool(p)
+        yield pool
+        pool.close()
+
+
+@pytest.fixture(scope="function")
+def browser_name():
+    """
+    web_page가 사용할 브라우저 엔진
+
+    매트릭스 모드(--browsers)에서는 엔진별 파라미터로 대체됩니다.
+
+    Returns:
+        str: 기본 엔진 (chromium)
+    """
+    return DEFAULT_BROWSER
+
+
+@pytest.fixture(scope="function")
+def web_page(request, browser_pool, browser_name):
+    """
+    Playwright 페이지 fixture
+
+    풀에서 엔진별 브라우저를 받아 새 컨텍스트에 JWT 토큰이 주입된 페이지를 생성하여 각 테스트에 제공합니다.
+    chaos 시나리오가 적용 중이면 페이지 요청에도 같은 규칙으로 장애를 주입하고,
+    WEB_TIMEOUT_MS가 설정되어 있으면 Playwright 기본 timeout(30초) 대신 사용합니다.
+    트레이스와 비디오(선택)는 테스트 동안 기록만 해두고, 테스트가 실패한 경우에만
+    스크린샷과 함께 Result/<timestamp>/artifacts/ 아래에 저장합니다.
+    트레이스는 모든 테스트에서 기록되므로 프레임마다 캡처하는 screencast 스크린샷 없이
+    DOM 스냅샷만 기록하며, 실패 시점 화면은 별도 스크린샷으로 남깁니다.
+
+    Yields:
+        Page: JWT 토큰이 설정된 Playwright Page 인스턴스
+    """
+    kinds = get_artifact_kinds()
+    with tempfile.TemporaryDirectory(prefix="web-video-") as video_tmp:
+        browser = browser_pool.get(browser_name)
+        context = browser.new_context(record_video_dir=video_tmp if "video" in kinds else None)
+        if os.getenv("WEB_TIMEOUT_MS"):
+            context.set_default_timeout(float(os.getenv("WEB_TIMEOUT_MS")))
+        if "trace" in kinds:
+            context.tracing.start(screenshots=False, snapshots=True, sources=False)
+        jwt_token = os.getenv("JWT_TOKEN")
+        page = context.new_page()
+        setup_page_with_token(context, page, jwt_token)
+        route_chaos(page)
+
+        yield page
+
+        failed = bool(kinds) and _test_failed(request.node)
+        artifacts = _artifact_dir(request.node) if failed else None
+        if failed and "screenshot" in kinds:
+            _save_artifact(request.node, artifacts / "screenshot.png",
+                           lambda path: page.screenshot(path=path, full_page=True))
+        if "trace" in kinds:
+            if failed:
+                _save_artifact(request.node, artifacts / "trace.zip",
+                               lambda path: context.tracing.stop(path=path))
+            else:
+                context.tracing.stop()
+        context.close()
+        if page.video:
+            if failed:
+                _save_artifact(request.node, artifacts / "video.webm", page.video.save_as)
+            page.video.delete()
+
+
+def _save_artifact(item, path, save):
+    """
+    아티팩트 저장 후 결과 스트림에 경로 등록
+
+    Args:
+        item: pytest Item
+        path: 저장할 파일 경로
+        save: 경로를 받아 파일을 저장하는 함수
+    """
+    try:
+        save(str(path))
+    except PlaywrightError as e:
+        log.warning(f"[ARTIFACT] 저장 실패: {path.name} ({e})")
+        return
+    item.user_properties.append((ARTIFACT_PROPERTY, str(path)))
+    log.info(f"[ARTIFACT] 실패 아티팩트 저장: {path}")
@@ -0,0 +1,218 @@
+"""results.jsonl 스트림으로부터 요약 및 HTML 리포트 생성
+
+결과 파일을 한 줄씩 읽어 처리하므로 테스트 수가 늘어나도 메모리 사용량이 일정하며,
+비정상 종료된 실행의 결과도 그대로 렌더링할 수 있습니다.
+
+    python -m src.reporting.html_report Result/<timestamp>
+"""
+import argparse
+import html
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+RESULTS_FILE = "results.jsonl"
+
+STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; font-size: 12px; color: #333; }
+h1 { font-size: 24px; }
+table { border-collapse: collapse; }
+th, td { border: 1px solid #e6e6e6; padding: 4px 8px; text-align: left; vertical-align: top; }
+.passed { color: green; } .failed, .error { color: red; } .skipped, .xfailed, .xpassed { color: orange; }
+pre { white-space: pre-wrap; margin: 0; max-width: 1200px; }
+"""
+
+
+def iter_records(path, record_type=None):
+    """
+    결과 파일의 레코드를 한 줄씩 반환
+
+    비정상 종료로 마지막 줄이 잘린 경우 해당 줄은 건너뜁니다.
+
+    Args:
+        path: results.jsonl 경로
+        record_type: 지정 시 해당 type의 레코드만 반환
+
+    Yields:
+        dict: 결과 레코드
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                log.warning(f"손상된 결과 레코드 건너뜀: {line[:80]!r}")
+                continue
+            if record_type is None or record.get("type") == record_type:
+                yield record
+
+
+def summarize(path):
+    """
+    결과 파일 요약
+
+    Args:
+        path: results.jsonl 경로
+
+    Returns:
+        dict: 결과별 개수, 총 테스트 수, 누적 실행 시간, 세션 종료 여부,
+        브라우저 엔진별 테스트 수 / 실패 수 / 누적 / 최대 실행 시간, chaos 시나리오 이름,
+        테스트별 최대 메모리 중 최대값(MB) / 누수 의심 테스트 수 (--resource-profile 실행 시)
+    """
+    outcomes = Counter()
+    total_duration = 0.0
+    api_calls = 0
+    browsers = {}
+    finished = False
+    scenario = None
+    peak_rss_mb = None
+    leaks = 0
+    for record in iter_records(path):
+        if record.get("type") == "session":
+            scenario = record.get("chaos_scenario")
+            continue
+        if record.get("type") == "session_finish":
+            finished = True
+            continue
+        if record.get("type") != "test":
+            continue
+        outcomes[record["outcome"]] += 1
+        total_duration += record.get("duration", 0.0)
+        api_calls += len(record.get("api_calls", []))
+        resources = record.get("properties", {}).get("resources")
+        if resources:
+            peak_rss_mb = max(peak_rss_mb or 0.0, resources["peak_total_rss_mb"])
+            leaks += resources["leak"]
+        browser = record.get("properties", {}).get("browser")
+        if browser:
+            stats = browsers.setdefault(browser, {"tests": 0, "failed": 0, "duration": 0.0, "max": 0.0})
+            stats["tests"] += 1
+            stats["failed"] += record["outcome"] in ("failed", "error")
+            stats["duration"] = round(stats["duration"] + record.get("duration", 0.0), 3)
+            stats["max"] = max(stats["max"], record.get("duration", 0.0))
+    return {
+        "outcomes": dict(outcomes),
+        "total": sum(outcomes.values()),
+        "duration": round(total_duration, 3),
+        "api_calls": api_calls,
+        "finished": finished,
+        "browsers": browsers,
+        "chaos_scenario": scenario,
+        "peak_rss_mb": peak_rss_mb,
+        "leaks": leaks,
+    }
+
+
+def _artifact_links(record, base_dir):
+    links = []
+    for artifact in record.get("artifacts", []):
+        href = os.path.relpath(artifact, base_dir) if os.path.isabs(artifact) else artifact
+        links.append(f'<a href="{html.escape(href)}">{html.escape(Path(artifact).name)}</a>')
+    return "<br>".join(links)
+
+
+def _hotspots(profile):
+    lines = [f"{hotspot['self_ms']:>9.1f} ms  {hotspot['function']}{'  (I/O wait)' if hotspot.get('wait') else ''}"
+             for hotspot in profile["hotspots"]]
+    wait = "" if profile["wait_ratio"] is None else f", I/O wait {profile['wait_ratio']:.0%}"
+    return f"<pre>{profile['mode']} profile{wait}\n{html.escape(chr(10).join(lines))}</pre>"
+
+
+def _row(record, base_dir):
+    outcome = record["outcome"]
+    api_calls = record.get("api_calls", [])
+    api_ms = sum(call["elapsed_ms"] for call in api_calls)
+    decode_ms = sum(call.get("decode_ms") or 0.0 for call in api_calls)
+    api_kb = sum(call.get("bytes") or 0 for call in api_calls) / 1024
+    resources = record.get("properties", {}).get("resources")
+    memory = f"{resources['peak_total_rss_mb']:.0f}{' (leak?)' if resources['leak'] else ''}" if resources else ""
+    longrepr = record.get("longrepr")
+    detail = f"<pre>{html.escape(longrepr)}</pre>" if longrepr else ""
+    profile = record.get("properties", {}).get("profile")
+    if profile:
+        detail += _hotspots(profile)
+    return (
+        f'<tr><td class="{outcome}">{outcome}</td>'
+        f"<td>{html.escape(record['nodeid'])}</td>"
+        f"<td>{record.get('duration', 0.0):.3f}</td>"
+        f"<td>{len(api_calls)} / {api_ms:.1f} / {decode_ms:.1f} / {api_kb:.1f}</td>"
+        f"<td>{memory}</td>"
+        f"<td>{_artifact_links(record, base_dir)}</td>"
+        f"<td>{detail}</td></tr>\n"
+    )
+
+
+def render_html(path, html_path=None):
+    """
+    결과 파일로부터 HTML 리포트 생성
+
+    요약 계산과 행 출력을 각각 스트림으로 처리하여 결과 전체를 메모리에 올리지 않습니다.
+
+    Args:
+        path: results.jsonl 경로
+        html_path: 출력할 HTML 경로 (기본값: 같은 디렉토리의 report_<run_id>.html)
+
+    Returns:
+        Path: 생성된 HTML 리포트 경로
+    """
+    path = Path(path)
+    html_path = Path(html_path) if html_path else path.parent / f"report_{path.parent.name}.html"
+    summary = summarize(path)
+    counts = ", ".join(f"{count} {outcome}" for outcome, count in sorted(summary["outcomes"].items()))
+    status = "" if summary["finished"] else " (incomplete run)"
+    if summary["chaos_scenario"]:
+        status += f" [chaos: {html.escape(summary['chaos_scenario'])}]"
+
+    with html_path.open("w", encoding="utf-8") as out:
+        out.write(f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\"/>\n"
+                  f"<title>{html.escape(html_path.name)}</title>\n<style>{STYLE}</style>\n</head>\n<body>\n")
+        out.write(f"<h1>{html.escape(html_path.name)}</h1>\n")
+        out.write(f"<p>{summary['total']} tests{status}: {counts or 'none'}. "
+                  f"Duration {summary['duration']:.2f}s, {summary['api_calls']} API calls.</p>\n")
+        if summary["peak_rss_mb"] is not None:
+            out.write(f"<p>Peak memory (pytest + browsers) {summary['peak_rss_mb']:.0f} MB, "
+                      f"{summary['leaks']} leak suspects. Timeline: resources*.jsonl</p>\n")
+        if summary["browsers"]:
+            out.write("<table>\n<tr><th>Browser</th><th>Tests</th><th>Failed</th>"
+                      "<th>Total (s)</th><th>Avg (s)</th><th>Max (s)</th></tr>\n")
+            for browser, stats in sorted(summary["browsers"].items()):
+                out.write(f"<tr><td>{html.escape(browser)}</td><td>{stats['tests']}</td>"
+                          f"<td>{stats['failed']}</td><td>{stats['duration']:.2f}</td>"
+                          f"<td>{stats['duration'] / stats['tests']:.2f}</td><td>{stats['max']:.2f}</td></tr>\n")
+            out.write("</table>\n")
+        out.write("<table>\n<tr><th>Result</th><th>Test</th><th>Duration (s)</th>"
+                  "<th>API calls / ms / decode ms / KB</th><th>Peak RSS (MB)</th>"
+                  "<th>Artifacts</th><th>Details</th></tr>\n")
+        for record in iter_records(path, record_type="test"):
+            out.write(_row(record, html_path.parent))
+        out.write("</table>\n</body>\n</html>\n")
+
+    log.info(f"HTML 리포트 생성 완료: {html_path}")
+    return html_path
+
+
+def main(argv=None):
+    """결과 디렉토리 또는 results.jsonl로부터 요약 출력 및 HTML 리포트 생성"""
+    parser = argparse.ArgumentParser(description="results.jsonl 기반 리포트 생성")
+    parser.add_argument("path", help="Result/<timestamp>/ 디렉토리 또는 results.jsonl 경로")
+    parser.add_argument("--summary-only", action="store_true", help="HTML 생성 없이 요약만 출력")
+    args = parser.parse_args(argv)
+
+    path = Path(args.path)
+    if path.is_dir():
+        path = path / RESULTS_FILE
+
+    print(json.dumps(summarize(path), ensure_ascii=False, indent=2))
+    if not args.summary_only:
+        print(render_html(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+"""Result/ 실행 이력 인덱스
+
+각 실행의 results.jsonl을 SQLite 파일(Result/index.sqlite)에 적재하여
+HTML 리포트를 다시 파싱하지 않고 테스트 결과, 실행 시간, API 응답 시간,
+Web 동작 시간을 조회합니다. chaos 시나리오로 실행한 결과는 일반 조회(이력, Flaky 비율,
+스케줄링용 평균 시간)에서 제외하고 chaos 조회에서만 사용합니다. 인덱스는 results.jsonl로부터 언제든 다시 만들 수 있는
+파생 데이터이므로, 스키마 버전이 바뀌면 테이블을 새로 만들고 다시 적재합니다.
+
+    python -m src.reporting.run_index slowest --runs 30 --limit 20
+    python -m src.reporting.run_index trend "POST /api/todos" --runs 30
+    python -m src.reporting.run_index flaky --runs 30
+    python -m src.reporting.run_index chaos slow_backend --runs 5
+"""
+import argparse
+import logging
+import math
+import re
+import sqlite3
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from src.reporting.html_report import RESULTS_FILE, iter_records
+from src.utils.result_dir import INDEX_FILE, INDEX_PATH, RESULT_ROOT, iter_run_dirs
+
+log = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 4
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{16,}|[0-9a-fA-F-]{36})$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT,
+    finished INTEGER NOT NULL DEFAULT 0,
+    exitstatus INTEGER,
+    duration REAL,
+    scenario TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL,
+    call_duration REAL,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    injected_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tests_run ON tests (run_id);
+CREATE INDEX IF NOT EXISTS idx_tests_nodeid ON tests (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS api_calls (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    status INTEGER,
+    elapsed_ms REAL,
+    bytes INTEGER,
+    decode_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_api_calls_endpoint ON api_calls (method, endpoint, run_id, elapsed_ms);
+CREATE INDEX IF NOT EXISTS idx_api_calls_run ON api_calls (run_id);
+CREATE TABLE IF NOT EXISTS web_timings (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    action TEXT NOT NULL,
+    target TEXT,
+    elapsed_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_web_timings_action ON web_timings (action, run_id);
+CREATE INDEX IF NOT EXISTS idx_web_timings_run ON web_timings (run_id);
+"""
+TABLES = ("runs", "tests", "api_calls", "web_timings")
+
+
+def normalize_endpoint(url):
+    """
+    URL을 집계용 엔드포인트로 변환
+
+    숫자/UUID/해시 형태의 경로 세그먼트는 {id}로 치환합니다.
+
+    Args:
+        url: 요청 URL
+
+    Returns:
+        str: /api/todos/{id} 형태의 경로
+    """
+    path = urlsplit(url).path or "/"
+    segments = ["{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return "/".join(segments).rstrip("/") or "/"
+
+
+def percentile(sorted_values, pct):
+    """
+    정렬된 값 목록의 백분위수(nearest-rank)
+
+    Args:
+        sorted_values: 오름차순 정렬된 값 목록
+        pct: 백분위 (0~100)
+
+    Returns:
+        float | None: 백분위수, 값이 없으면 None
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RunIndex:
+    """Result/ 실행 이력 SQLite 인덱스"""
+
+    def __init__(self, path=INDEX_PATH):
+        """
+        RunIndex 초기화
+
+        Args:
+            path: SQLite 인덱스 파일 경로
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """스키마 버전이 다르면 테이블을 새로 생성"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            log.info(f"[INDEX] 스키마 버전 변경({version} -> {SCHEMA_VERSION}), 인덱스를 다시 생성합니다")
+            for table in TABLES:
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def close(self):
+        """인덱스 연결 종료"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def finished_run_ids(self):
+        """
+        적재가 완료된(세션 종료 레코드가 있는) 실행 ID 집합
+
+        Returns:
+            set[str]: 실행 ID 집합
+        """
+        return {row[0] for row in self.conn.execute("SELECT run_id FROM runs WHERE finished = 1")}
+
+    def ingest_run(self, run_dir):
+        """
+        실행 한 건의 results.jsonl을 인덱스에 적재
+
+        이미 적재된 실행이면 기존 행을 지우고 다시 적재합니다.
+
+        Args:
+            run_dir: Result/<timestamp>/ 디렉토리
+
+        Returns:
+            bool: 적재 여부 (results.jsonl이 없으면 False)
+        """
+        results = run_dir / RESULTS_FILE
+        if not results.exists():
+            return False
+
+        run_id = run_dir.name
+        run = {"run_id": run_id, "started_at": None, "finished": 0, "exitstatus": None, "duration": None,
+               "scenario": None}
+        tests, api_calls, web_timings = [], [], []
+        for record in iter_records(results):
+            record_type = record.get("type")
+            if record_type == "session":
+                run.update(started_at=record.get("started_at"), scenario=record.get("chaos_scenario"))
+            elif record_type == "session_finish":
+                run.update(finished=1, exitstatus=record.get("exitstatus"), duration=record.get("duration"))
+            elif record_type == "test":
+                nodeid = record["nodeid"]
+                chaos = record.get("properties", {}).get("chaos") or {}
+                tests.append((run_id, nodeid, record["outcome"], record.get("duration"),
+                              record.get("phases", {}).get("call"), record.get("attempts", 1),
+                              chaos.get("delay_ms")))
+                for call in record.get("api_calls", []):
+                    api_calls.append((run_id, nodeid, call["method"], normalize_endpoint(call["url"]),
+                                      call.get("status"), call.get("elapsed_ms"), call.get("bytes"),
+                                      call.get("decode_ms")))
+                for timing in record.get("web_timings", []):
+                    web_timings.append((run_id, nodeid, timing["action"], timing.get("target"),
+                                        timing.get("elapsed_ms")))
+
+        with self.conn:
+            for table in TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            self.conn.execute(
+                "INSERT INTO runs VALUES (:run_id, :started_at, :finished, :exitstatus, :duration, :scenario)", run)
+            self.conn.executemany("INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?)", tests)
+            self.conn.executemany("INSERT INTO api_calls VALUES (?, ?, ?, ?, ?, ?, ?, ?)", api_calls)
+            self.conn.executemany("INSERT INTO web_timings VALUES (?, ?, ?, ?, ?)", web_timings)
+        log.debug(f"[INDEX] 실행 적재: {run_id} (tests={len(tests)}, api_calls={len(api_calls)})")
+        return True
+
+    def ingest_all(self, root=RESULT_ROOT):
+        """
+        아직 적재되지 않았거나 미완료 상태로 적재된 실행을 모두 적재
+
+        Args:
+            root: 결과 루트 디렉토리
+
+        Returns:
+            int: 새로 적재한 실행 수
+        """
+        finished = self.finished_run_ids()
+        return sum(self.ingest_run(run_dir) for run_dir in iter_run_dirs(root) if run_dir.name not in finished)
+
+    def _recent_runs_clause(self, runs):
+        return ("run_id IN (SELECT run_id FROM runs WHERE scenario IS NULL ORDER BY run_id DESC LIMIT ?)",
+                (runs,))
+
+    def slowest_tests(self, runs=30, limit=20):
+        """
+        최근 실행 기준 평균 실행 시간이 긴 테스트
+
+        Args:
+            runs: 대상 실행 수
+            limit: 반환할 테스트 수
+
+        Returns:
+            list[tuple]: (nodeid, 실행 횟수, 평균 시간, 최대 시간)
+        """
+        clause, params = self._recent_runs_clause(runs)
+        return self.conn.execute(
+            f"SELECT nodeid, COUNT(*), AVG(duration), MAX(duration) FROM tests "
+            f"WHERE {clause} AND outcome NOT IN ('skipped', 'deselected') "
+            f"GROUP BY nodeid ORDER BY AVG(duration) DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+
+    def average_durations(self, runs=30):
+        """
+        최근 실행 기준 테스트별 평균 실행 시간 (스케줄링용)
+
+        Args:
+            runs: 대상 실행 수
+
+        Returns:
+            dict[str, float]: nodeid별 평균 실행 시간(초)
+        """
+        clause, params = self._recent_runs_clause(runs)
+        rows = self.conn.execute(
+            f"SELECT nodeid, AVG(duration) FROM tests "
+            f"WHERE {clause} AND outcome NOT IN ('skipped', 'deselected') AND duration IS NOT NULL "
+            f"GROUP BY nodeid",
+            params,
+        )
+        return dict(rows.fetchall())
+
+    def failure_stats(self, runs=30):
+        """
+        최근 실행 기준 테스트별 실행 횟수 / 최종 실패 횟수 / 평균 실행 시간 (배포 게이트 우선순위용)
+
+        재실행 후 통과한 경우는 실패로 보지 않으므로 실패 횟수는 실제로 회귀를 잡아낸 횟수에 가깝습니다.
+
+        Args:
+            runs: 대상 실행 수
+
+        Returns:
+            dict[str, tuple]: nodeid별 (실행 횟수, 실패 횟수, 평균 실행 시간 초)
+        """
+        clause, params = self._recent_runs_clause(runs)
+        rows = self.conn.execute(
+            f"SELECT nodeid, COUNT(*), SUM(outcome IN ('failed', 'error')), AVG(duration) FROM tests "
+            f"WHERE {clause} AND outcome IN ('passed', 'failed', 'error') GROUP BY nodeid",
+            params,
+        )
+        return {nodeid: (total, failures, duration) for nodeid, total, failures, duration in rows}
+
+    def endpoint_trend(self, method, endpoint, runs=30, pct=95):
+        """
+        실행별 API 응답 시간 / 디코딩 시간 백분위수 및 평균 응답 크기 추이
+
+        Args:
+            method: HTTP 메서드
+            endpoint: 정규화된 엔드포인트 (/api/todos, /api/todos/{id} 등)
+            runs: 대상 실행 수
+            pct: 백분위
+
+        Returns:
+            list[tuple]: 오래된 순 (run_id, 호출 수, 응답 시간 백분위수 ms,
+            디코딩 시간 백분위수 ms, 평균 응답 크기 bytes), 기록이 없는 값은 None
+        """
+        clause, params = self._recent_runs_clause(runs)
+        rows = self.conn.execute(
+            f"SELECT run_id, elapsed_ms, bytes, decode_ms FROM api_calls "
+            f"WHERE method = ? AND endpoint = ? AND {clause} ORDER BY run_id, elapsed_ms",
+            (method.upper(), endpoint, *params),
+        )
+
+        def summarize(run_id, values, sizes, decodes):
+            decode_pct = percentile(sorted(decodes), pct) if decodes else None
+            avg_bytes = sum(sizes) / len(sizes) if sizes else None
+            return run_id, len(values), percentile(values, pct), decode_pct, avg_bytes
+
+        trend = []
+        current, values, sizes, decodes = None, [], [], []
+        for run_id, elapsed_ms, size, decode_ms in rows:
+            if run_id != current and values:
+                trend.append(summarize(current, values, sizes, decodes))
+                values, sizes, decodes = [], [], []
+            current = run_id
+            values.append(elapsed_ms)
+            if size is not None:
+                sizes.append(size)
+            if decode_ms is not None:
+                decodes.append(decode_ms)
+        if values:
+            trend.append(summarize(current, values, sizes, decodes))
+        return trend
+
+    def flaky_tests(self, runs=30, min_runs=3, limit=20):
+        """
+        최근 실행에서 성공과 실패가 섞여 있거나 재실행 후 통과한 테스트 (불안정 비율 순)
+
+        Args:
+            runs: 대상 실행 수
+            min_runs: 최소 실행 횟수
+            limit: 반환할 테스트 수
+
+        Returns:
+            list[tuple]: (nodeid, 실행 횟수, 실패 횟수, 재실행 후 통과 횟수, 불안정 비율)
+        """
+        clause, params = self._recent_runs_clause(runs)
+        return self.conn.execute(
+            f"SELECT nodeid, COUNT(*) AS total, "
+            f"SUM(outcome IN ('failed', 'error')) AS failures, "
+            f"SUM(outcome = 'passed' AND attempts > 1) AS flaky_passes, "
+            f"1.0 * (SUM(outcome IN ('failed', 'error')) + SUM(outcome = 'passed' AND attempts > 1)) "
+            f"/ COUNT(*) AS flaky_rate "
+            f"FROM tests WHERE {clause} AND outcome IN ('passed', 'failed', 'error') "
+            f"GROUP BY nodeid HAVING total >= ? AND "
+            f"((failures > 0 AND failures < total) OR flaky_passes > 0) "
+            f"ORDER BY flaky_rate DESC, total DESC LIMIT ?",
+            (*params, min_runs, limit),
+        ).fetchall()
+
+    def flake_rates(self, runs=30, min_runs=5):
+        """
+        테스트별 재실행 후 통과 비율
+
+        같은 실행 안에서 실패 후 재실행으로 통과한 경우만 Flaky로 집계하므로,
+        계속 실패하는 테스트(실제 회귀)는 포함되지 않습니다.
+
+        Args:
+            runs: 대상 실행 수
+            min_runs: 최소 실행 횟수
+
+        Returns:
+            dict[str, float]: nodeid별 Flaky 비율
+        """
+        clause, params = self._recent_runs_clause(runs)
+        rows = self.conn.execute(
+            f"SELECT nodeid, 1.0 * SUM(outcome = 'passed' AND attempts > 1) / COUNT(*) FROM tests "
+            f"WHERE {clause} AND outcome IN ('passed', 'failed', 'error') "
+            f"GROUP BY nodeid HAVING COUNT(*) >= ?",
+            (*params, min_runs),
+        )
+        return {nodeid: rate for nodeid, rate in rows if rate > 0}
+
+    def chaos_degradation(self, scenario=None, runs=30, run_id=None):
+        """
+        chaos 실행과 일반 실행의 테스트별 실행 시간 / 통과율 비교
+
+        excess_s는 chaos 실행 시간 증가분에서 주입한 지연을 뺀 값으로, 양수가 크면 대기 / 폴링이
+        지연보다 과하게 늘어난 것(여유 없는 고정 대기, 긴 폴링 간격)이고, 통과율 하락은 timeout이나
+        재시도 예산이 지연을 견디지 못한 것입니다.
+
+        Args:
+            scenario: 비교할 chaos 시나리오 이름 (run_id를 지정하면 생략)
+            runs: 각 집단의 대상 실행 수
+            run_id: 특정 chaos 실행 하나만 비교할 때의 실행 ID
+
+        Returns:
+            list[tuple]: 통과율 하락이 큰 순, excess_s가 큰 순 (nodeid, 일반 평균 s, chaos 평균 s, 주입 지연 s, excess_s,
+            일반 통과율, chaos 통과율), 일반 실행 이력이 없으면 일반 값과 excess_s는 None
+        """
+        if run_id is not None:
+            chaos_clause, chaos_params = "run_id = ?", (run_id,)
+        else:
+            chaos_clause = "run_id IN (SELECT run_id FROM runs WHERE scenario = ? ORDER BY run_id DESC LIMIT ?)"
+            chaos_params = (scenario, runs)
+        base_clause, base_params = self._recent_runs_clause(runs)
+        return self.conn.execute(
+            f"SELECT c.nodeid, b.duration, c.duration, c.injected, "
+            f"c.duration - b.duration - c.injected, b.pass_rate, c.pass_rate "
+            f"FROM (SELECT nodeid, AVG(duration) AS duration, AVG(COALESCE(injected_ms, 0)) / 1000 AS injected, "
+            f"AVG(outcome = 'passed') AS pass_rate FROM tests "
+            f"WHERE {chaos_clause} AND outcome NOT IN ('skipped', 'deselected') GROUP BY nodeid) c "
+            f"LEFT JOIN (SELECT nodeid, AVG(duration) AS duration, AVG(outcome = 'passed') AS pass_rate FROM tests "
+            f"WHERE {base_clause} AND outcome NOT IN ('skipped', 'deselected') GROUP BY nodeid) b "
+            f"ON b.nodeid = c.nodeid "
+            f"ORDER BY c.pass_rate - COALESCE(b.pass_rate, c.pass_rate), "
+            f"c.duration - COALESCE(b.duration, c.duration) - c.injected DESC",
+            (*chaos_params, *base_params),
+        ).fetchall()
+
+
+def _print_rows(headers, rows):
+    print("\t".join(headers))
+    for row in rows:
+        print("\t".join(f"{value:.3f}" if isinstance(value, float) else str(value) for value in row))
+
+
+def main(argv=None):
+    """실행 이력 인덱스 적재 및 조회 CLI"""
+    parser = argparse.ArgumentParser(description="Result/ 실행 이력 조회")
+    parser.add_argument("--index", default=str(INDEX_PATH), help="SQLite 인덱스 경로")
+    parser.add_argument("--no-ingest", action="store_true", help="조회 전 신규 실행 적재 생략")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("ingest", help="신규 실행 적재")
+
+    slowest = sub.add_parser("slowest", help="평균 실행 시간이 긴 테스트")
+    slowest.add_argument("--runs", type=int, default=30)
+    slowest.add_argument("--limit", type=int, default=20)
+
+    trend = sub.add_parser("trend", help="API 응답 시간 / 디코딩 시간 백분위수, 응답 크기 추이")
+    trend.add_argument("endpoint", help='"METHOD /path" 형식 (예: "POST /api/todos")')
+    trend.add_argument("--runs", type=int, default=30)
+    trend.add_argument("--pct", type=float, default=95)
+
+    chaos = sub.add_parser("chaos", help="chaos 시나리오 실행의 테스트별 실행 시간 / 통과율 저하")
+    chaos.add_argument("scenario", help="chaos/scenarios.json의 시나리오 이름")
+    chaos.add_argument("--runs", type=int, default=30)
+
+    flaky = sub.add_parser("flaky", help="불안정 비율 기준 Flaky 테스트")
+    flaky.add_argument("--runs", type=int, default=30)
+    flaky.add_argument("--min-runs", type=int, default=3)
+    flaky.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+    with RunIndex(Path(args.index)) as index:
+        if args.command == "ingest" or not args.no_ingest:
+            ingested = index.ingest_all()
+            if args.command == "ingest":
+                print(f"{ingested} runs ingested")
+                return
+
+        if args.command == "slowest":
+            _print_rows(("nodeid", "runs", "avg_s", "max_s"), index.slowest_tests(args.runs, args.limit))
+        elif args.command == "trend":
+            method, _, endpoint = args.endpoint.partition(" ")
+            _print_rows(("run_id", "calls", f"p{args.pct:g}_ms", f"p{args.pct:g}_decode_ms", "avg_bytes"),
+                        index.endpoint_trend(method, endpoint.strip(), args.runs, args.pct))
+        elif args.command == "chaos":
+            _print_rows(("nodeid", "base_s", "chaos_s", "injected_s", "excess_s", "base_pass", "chaos_pass"),
+                        index.chaos_degradation(args.scenario, args.runs))
+        elif args.command == "flaky":
+            _print_rows(("nodeid", "runs", "failures", "flaky_passes", "flaky_rate"),
+                        index.flaky_tests(args.runs, args.min_runs, args.limit))
+
+
+if __name__ == "__main__":
+    main()
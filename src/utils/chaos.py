@@ -0,0 +1,307 @@
+"""장애 / 지연 주입(chaos) 유틸리티
+
+chaos/scenarios.json에 선언한 시나리오에 따라 엔드포인트 패턴별로 지연(latency), 지터(jitter),
+연결 끊김(drop), 5xx 응답을 주입합니다. 같은 규칙을 BaseAPI의 requests 세션(ChaosAdapter)과
+Playwright 페이지(route 핸들러)에 동일하게 적용합니다.
+
+규칙의 pattern은 URL 경로에 대한 fnmatch 패턴입니다 (예: /api/todos, /api/todos/*, /api/*).
+요청마다 처음 일치하는 규칙 하나만 적용합니다.
+"""
+import fnmatch
+import json
+import logging
+import random
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.env_loader import get_project_root
+
+log = logging.getLogger(__name__)
+
+SCENARIO_PATH = get_project_root() / "chaos" / "scenarios.json"
+DEFAULT_ERROR_STATUS = 503
+FAULT_KINDS = ("latency", "drop", "error")
+
+_active = None
+_faults = []
+
+
+class ChaosRule:
+    """엔드포인트 패턴 하나에 대한 장애 주입 규칙"""
+
+    def __init__(self, pattern, methods=None, latency_ms=0, jitter_ms=0, drop_rate=0.0, error_rate=0.0,
+                 status=DEFAULT_ERROR_STATUS):
+        """
+        ChaosRule 초기화
+
+        Args:
+            pattern: URL 경로 fnmatch 패턴
+            methods: 적용할 HTTP 메서드 목록 (기본값: 전체)
+            latency_ms: 추가 지연(ms)
+            jitter_ms: 지연 편차(ms), latency_ms ± jitter_ms 범위에서 균등 분포
+            drop_rate: 연결 끊김 비율 (0~1)
+            error_rate: 5xx 응답 비율 (0~1)
+            status: error_rate로 반환할 상태 코드
+        """
+        if drop_rate + error_rate > 1:
+            raise ValueError(f"drop_rate + error_rate는 1 이하여야 합니다: {pattern}")
+        self.pattern = pattern
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.drop_rate = drop_rate
+        self.error_rate = error_rate
+        self.status = status
+
+    def matches(self, method, path):
+        """요청이 규칙 대상인지 확인"""
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+        return fnmatch.fnmatchcase(path, self.pattern)
+
+
+class Fault:
+    """요청 하나에 주입할 장애"""
+
+    __slots__ = ("kind", "delay_ms", "status", "pattern")
+
+    def __init__(self, kind, delay_ms, status, pattern):
+        """
+        Fault 초기화
+
+        Args:
+            kind: latency / drop / error
+            delay_ms: 응답 전 지연(ms)
+            status: error인 경우 반환할 상태 코드
+            pattern: 적용된 규칙 패턴
+        """
+        self.kind = kind
+        self.delay_ms = delay_ms
+        self.status = status
+        self.pattern = pattern
+
+
+class ChaosScenario:
+    """이름이 붙은 장애 주입 규칙 모음"""
+
+    def __init__(self, name, rules, seed=None, description=""):
+        """
+        ChaosScenario 초기화
+
+        Args:
+            name: 시나리오 이름
+            rules: ChaosRule 목록 (앞의 규칙이 우선)
+            seed: 난수 시드 (재현용)
+            description: 설명
+        """
+        self.name = name
+        self.rules = rules
+        self.description = description
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_dict(cls, name, spec):
+        """
+        scenarios.json 항목으로부터 시나리오 생성
+
+        Args:
+            name: 시나리오 이름
+            spec: {"description", "seed", "rules": [...]} 형식의 dict
+
+        Returns:
+            ChaosScenario: 생성된 시나리오
+        """
+        rules = [ChaosRule(**rule) for rule in spec.get("rules", [])]
+        return cls(name, rules, seed=spec.get("seed"), description=spec.get("description", ""))
+
+    def decide(self, method, url):
+        """
+        요청에 주입할 장애 결정 및 기록
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+
+        Returns:
+            Fault | None: 주입할 장애, 해당 규칙이 없거나 주입하지 않으면 None
+        """
+        path = urlsplit(url).path
+        rule = next((rule for rule in self.rules if rule.matches(method, path)), None)
+        if rule is None:
+            return None
+
+        delay_ms = max(0.0, rule.latency_ms + self._random.uniform(-rule.jitter_ms, rule.jitter_ms))
+        roll = self._random.random()
+        if roll < rule.drop_rate:
+            kind = "drop"
+        elif roll < rule.drop_rate + rule.error_rate:
+            kind = "error"
+        elif delay_ms > 0:
+            kind = "latency"
+        else:
+            return None
+        _faults.append({"kind": kind, "delay_ms": round(delay_ms, 1)})
+        log.debug(f"[CHAOS] {kind} {method} {path} ({rule.pattern}, {delay_ms:.0f}ms)")
+        return Fault(kind, delay_ms, rule.status, rule.pattern)
+
+
+def load_scenario(name, path=SCENARIO_PATH):
+    """
+    시나리오 파일에서 이름으로 시나리오 로드
+
+    Args:
+        name: 시나리오 이름
+        path: 시나리오 파일 경로
+
+    Returns:
+        ChaosScenario: 로드된 시나리오
+
+    Raises:
+        KeyError: 시나리오가 정의되지 않은 경우
+    """
+    with open(path, encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    if name not in scenarios:
+        raise KeyError(f"정의되지 않은 chaos 시나리오: {name} (정의됨: {', '.join(sorted(scenarios))})")
+    return ChaosScenario.from_dict(name, scenarios[name])
+
+
+def activate(scenario):
+    """
+    현재 프로세스에 시나리오 적용 (None이면 해제)
+
+    Args:
+        scenario: ChaosScenario 또는 None
+    """
+    global _active
+    _active = scenario
+
+
+def get_active_scenario():
+    """
+    현재 적용 중인 시나리오 반환
+
+    Returns:
+        ChaosScenario | None: 적용 중인 시나리오
+    """
+    return _active
+
+
+def drain_faults():
+    """
+    주입한 장애를 종류별 횟수와 총 지연 시간으로 요약하여 반환하고 비움
+
+    Returns:
+        dict: {"latency": n, "drop": n, "error": n, "delay_ms": 총 지연}
+    """
+    summary = dict.fromkeys(FAULT_KINDS, 0)
+    summary["delay_ms"] = 0.0
+    for fault in _faults:
+        summary[fault["kind"]] += 1
+        summary["delay_ms"] += fault["delay_ms"]
+    summary["delay_ms"] = round(summary["delay_ms"], 1)
+    _faults.clear()
+    return summary
+
+
+class ChaosAdapter(HTTPAdapter):
+    """시나리오에 따라 지연 / 연결 끊김 / 5xx 응답을 주입하는 requests 어댑터"""
+
+    def __init__(self, scenario, **kwargs):
+        """
+        ChaosAdapter 초기화
+
+        Args:
+            scenario: 적용할 ChaosScenario
+            **kwargs: HTTPAdapter 옵션
+        """
+        super().__init__(**kwargs)
+        self.scenario = scenario
+
+    def send(self, request, **kwargs):
+        """장애를 주입한 뒤 요청 전송 (또는 전송 없이 실패 / 오류 응답 반환)"""
+        fault = self.scenario.decide(request.method, request.url)
+        if fault is None:
+            return super().send(request, **kwargs)
+        if fault.delay_ms:
+            time.sleep(fault.delay_ms / 1000)
+        if fault.kind == "drop":
+            raise requests.ConnectionError(f"[CHAOS] 연결 끊김 주입: {request.method} {request.url}", request=request)
+        if fault.kind == "error":
+            return self._error_response(request, fault.status)
+        return super().send(request, **kwargs)
+
+    @staticmethod
+    def _error_response(request, status):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "Chaos Injected"
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"error": f"chaos injected {status}"}).encode()
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def install_chaos(session, scenario=None):
+    """
+    requests 세션에 장애 주입 어댑터 설치
+
+    Args:
+        session: requests Session
+        scenario: 적용할 시나리오 (기본값: 현재 적용 중인 시나리오)
+
+    Returns:
+        bool: 설치 여부
+    """
+    scenario = scenario or _active
+    if scenario is None:
+        return False
+    adapter = ChaosAdapter(scenario)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return True
+
+
+def route_chaos(page, scenario=None):
+    """
+    Playwright 페이지에 장애 주입 route 핸들러 등록
+
+    나중에 등록한 핸들러가 먼저 실행되므로 JWT 헤더 핸들러(setup_page_with_token) 다음에 호출하며,
+    장애를 주입하지 않는 요청은 route.fallback()으로 기존 핸들러에 넘깁니다.
+    지연은 page.wait_for_timeout으로 처리하여 다른 요청의 처리를 막지 않습니다.
+
+    Args:
+        page: Playwright Page
+        scenario: 적용할 시나리오 (기본값: 현재 적용 중인 시나리오)
+
+    Returns:
+        bool: 등록 여부
+    """
+    scenario = scenario or _active
+    if scenario is None:
+        return False
+
+    def handle_route(route):
+        request = route.request
+        fault = scenario.decide(request.method, request.url)
+        if fault is None:
+            route.fallback()
+            return
+        if fault.delay_ms:
+            page.wait_for_timeout(fault.delay_ms)
+        if fault.kind == "drop":
+            route.abort("connectionreset")
+        elif fault.kind == "error":
+            route.fulfill(status=fault.status, content_type="application/json",
+                          body=json.dumps({"error": f"chaos injected {fault.status}"}))
+        else:
+            route.fallback()
+
+    page.route("**/*", handle_route)
+    return True
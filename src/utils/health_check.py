@@ -1,11 +1,22 @@
 """Health check utilities"""
 import logging
+import os
 
 import requests
 
 log = logging.getLogger(__name__)
 
 
+def is_health_check_skipped():
+    """
+    SKIP_HEALTH_CHECK 환경 변수 확인
+
+    Returns:
+        bool: 헬스 체크 생략 여부
+    """
+    return os.getenv("SKIP_HEALTH_CHECK", "false").lower() == "true"
+
+
 def check_health(base_url, expect_json=False):
     """
     서버 헬스 체크
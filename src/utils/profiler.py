@@ -0,0 +1,202 @@
+"""테스트 실행 Python 프로파일링 유틸리티
+
+- StackSampler: 백그라운드 스레드가 일정 주기로 대상 스레드의 호출 스택(sys._current_frames)을 수집하는
+  저부하 샘플링 프로파일러입니다. 결과는 flamegraph.pl / speedscope에서 바로 열 수 있는
+  folded stack 형식("root;...;leaf count")으로 저장합니다.
+- CProfiler: cProfile 기반 결정적 프로파일러이며 결과는 pstats(.prof) 형식으로 저장합니다.
+
+두 프로파일러 모두 함수별 self 시간 기준 상위 hotspot 목록을 같은 형식으로 반환하며,
+hotspot마다 I/O 대기(select / socket read / lock wait 등) 여부가 함께 표시됩니다.
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+# 호출 스택 최하단(leaf)이 이 함수들이면 Python 코드 실행이 아닌 I/O / 이벤트 대기로 분류
+WAIT_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("socket.py", "readinto"),
+    ("ssl.py", "read"),
+    ("ssl.py", "recv_into"),
+}
+# cProfile은 C 함수도 기록하므로 대기 중 블로킹되는 내장 함수 이름으로 분류
+WAIT_BUILTINS = ("recv_into", "recv", "select", "poll", "acquire", "sleep", "connect", "getaddrinfo")
+
+
+def _frame_label(code):
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _is_wait(label):
+    filename, _, function = label.rpartition(":")
+    return (filename, function) in WAIT_FRAMES
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 수집하는 샘플링 프로파일러"""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        """
+        StackSampler 초기화
+
+        Args:
+            interval: 샘플링 주기(초)
+            thread_id: 대상 스레드 ID (기본값: 생성한 스레드)
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self):
+        """샘플링 시작"""
+        self.stacks.clear()
+        self.elapsed = time.perf_counter()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """샘플링 종료"""
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed = time.perf_counter() - self.elapsed
+
+    def save(self, path):
+        """
+        folded stack 형식으로 저장
+
+        Args:
+            path: 저장할 파일 경로 (.folded)
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def hotspots(self, limit=10):
+        """
+        leaf 함수(self 시간) 기준 상위 hotspot 목록
+
+        샘플 하나의 시간은 설정 주기가 아닌 실제 측정 시간 / 샘플 수로 계산합니다.
+
+        Args:
+            limit: 반환할 항목 수
+
+        Returns:
+            list[dict]: {"function", "self_ms", "total_ms", "wait"} 목록, self 시간 내림차순
+        """
+        self_counts, total_counts = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            labels = stack.split(";")
+            self_counts[labels[-1]] += count
+            for label in set(labels):
+                total_counts[label] += count
+        ms = self.elapsed * 1000 / max(1, sum(self.stacks.values()))
+        return [
+            {"function": label, "self_ms": round(count * ms, 1), "total_ms": round(total_counts[label] * ms, 1),
+             "wait": _is_wait(label)}
+            for label, count in self_counts.most_common(limit)
+        ]
+
+    def wait_ratio(self):
+        """
+        전체 샘플 중 I/O 대기 샘플 비율
+
+        Returns:
+            float | None: 0~1, 샘플이 없으면 None
+        """
+        total = sum(self.stacks.values())
+        if not total:
+            return None
+        waiting = sum(count for stack, count in self.stacks.items() if _is_wait(stack.rsplit(";", 1)[-1]))
+        return round(waiting / total, 3)
+
+
+def _builtin_label(filename, function):
+    """pstats 키를 hotspot 이름으로 변환 (내장 함수는 "~:<method 'x' of 'y' objects>" 형식)"""
+    if filename == "~":
+        return function
+    return f"{os.path.basename(filename)}:{function}"
+
+
+def _is_builtin_wait(filename, function):
+    return filename == "~" and any(f"'{name}'" in function or f" {name}>" in function for name in WAIT_BUILTINS)
+
+
+class CProfiler:
+    """cProfile 기반 결정적 프로파일러 (StackSampler와 같은 인터페이스)"""
+
+    def __init__(self):
+        """CProfiler 초기화"""
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        """프로파일링 시작"""
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        """프로파일링 종료"""
+        self.profile.disable()
+
+    def save(self, path):
+        """
+        pstats 형식으로 저장 (snakeviz, flameprof 등으로 시각화)
+
+        Args:
+            path: 저장할 파일 경로 (.prof)
+        """
+        self.profile.dump_stats(str(path))
+
+    def hotspots(self, limit=10):
+        """
+        함수별 self 시간(tottime) 기준 상위 hotspot 목록
+
+        Args:
+            limit: 반환할 항목 수
+
+        Returns:
+            list[dict]: {"function", "self_ms", "total_ms", "calls", "wait"} 목록, self 시간 내림차순
+        """
+        stats = pstats.Stats(self.profile).stats
+        ranked = sorted(stats.items(), key=lambda entry: entry[1][2], reverse=True)[:limit]
+        return [
+            {"function": _builtin_label(filename, function), "self_ms": round(tottime * 1000, 1),
+             "total_ms": round(cumtime * 1000, 1), "calls": calls, "wait": _is_builtin_wait(filename, function)}
+            for (filename, _, function), (_, calls, tottime, cumtime, _) in ranked
+        ]
+
+    def wait_ratio(self):
+        """
+        전체 self 시간 중 블로킹 내장 함수(WAIT_BUILTINS) 시간 비율
+
+        Returns:
+            float | None: 0~1, 기록이 없으면 None
+        """
+        stats = pstats.Stats(self.profile).stats
+        total = sum(entry[2] for entry in stats.values())
+        if not total:
+            return None
+        waiting = sum(entry[2] for (filename, _, function), entry in stats.items()
+                      if _is_builtin_wait(filename, function))
+        return round(waiting / total, 3)
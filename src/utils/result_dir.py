@@ -0,0 +1,174 @@
+"""테스트 실행 결과 디렉토리(Result/<timestamp>/) 관리 유틸리티"""
+import logging
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.utils.env_loader import get_project_root
+
+log = logging.getLogger(__name__)
+
+RESULT_ROOT = get_project_root() / "Result"
+INDEX_FILE = "index.sqlite"
+INDEX_PATH = RESULT_ROOT / INDEX_FILE
+RUN_DIR_KEY = pytest.StashKey()
+RUN_DIR_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(?:_(\d+))?$")
+DEFAULT_MAX_MB = 1024
+# 테스트를 실행하지 않고 종료하는 옵션 (결과 디렉토리를 만들지 않음)
+NO_RUN_OPTIONS = ("help", "collectonly", "showfixtures", "show_fixtures_per_test", "markers")
+
+
+def create_run_dir(root=RESULT_ROOT):
+    """
+    실행 시각 기준 결과 디렉토리 생성
+
+    같은 초에 시작한 실행끼리 결과 파일을 섞지 않도록 이미 있는 이름이면
+    Result/<timestamp>_1/, Result/<timestamp>_2/ ... 순서로 새 디렉토리를 만듭니다.
+
+    Args:
+        root: 결과 루트 디렉토리
+
+    Returns:
+        Path: 생성된 Result/<timestamp>[_N]/ 경로
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    root.mkdir(parents=True, exist_ok=True)
+    run_dir, suffix = root / timestamp, 0
+    while True:
+        try:
+            run_dir.mkdir()
+            break
+        except FileExistsError:
+            suffix += 1
+            run_dir = root / f"{timestamp}_{suffix}"
+    log.debug(f"결과 디렉토리 생성: {run_dir}")
+    return run_dir
+
+
+def is_test_run(config):
+    """
+    결과 디렉토리가 필요한 실행인지 확인
+
+    --help, --collect-only, --fixtures, --markers처럼 테스트를 실행하지 않는 호출은 제외합니다.
+
+    Args:
+        config: pytest Config 인스턴스
+
+    Returns:
+        bool: 테스트를 실행하면 True
+    """
+    return not any(config.getoption(name, False) for name in NO_RUN_OPTIONS)
+
+
+def get_run_dir(config):
+    """
+    현재 세션의 결과 디렉토리 반환
+
+    Args:
+        config: pytest Config 인스턴스
+
+    Returns:
+        Path | None: Result/<timestamp>/ 경로, 테스트를 실행하지 않는 호출(is_test_run)이면 None
+    """
+    return config.stash.get(RUN_DIR_KEY, None)
+
+
+def iter_run_dirs(root=RESULT_ROOT):
+    """
+    결과 루트 아래의 실행 디렉토리를 오래된 순으로 반환
+
+    Args:
+        root: 결과 루트 디렉토리
+
+    Returns:
+        list[Path]: Result/<timestamp>[_N]/ 경로 목록
+    """
+    if not root.exists():
+        return []
+    runs = {}
+    for d in root.iterdir():
+        match = RUN_DIR_PATTERN.match(d.name)
+        if d.is_dir() and match:
+            runs[d] = (match.group(1), int(match.group(2) or 0))
+    return sorted(runs, key=runs.get)
+
+
+def _dir_size(path):
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def tracked_run_dirs(root=RESULT_ROOT):
+    """
+    git으로 관리되는 파일을 포함한 실행 디렉토리 이름 목록 (README에서 링크하는 기준 리포트 등)
+
+    Args:
+        root: 결과 루트 디렉토리
+
+    Returns:
+        set[str]: 실행 디렉토리 이름, git 저장소가 아니거나 git을 실행할 수 없으면 빈 집합
+    """
+    try:
+        output = subprocess.run(["git", "ls-files", "-z", "--", "."], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    return {path.split("/", 1)[0] for path in output.split("\0") if "/" in path}
+
+
+def get_max_result_bytes():
+    """
+    RESULT_MAX_MB 환경 변수로 설정한 결과 디렉토리 최대 용량 반환
+
+    Returns:
+        int: 최대 용량(bytes), 0 이하이면 제한 없음
+    """
+    return int(float(os.getenv("RESULT_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+def enforce_retention(max_bytes, root=RESULT_ROOT, keep=()):
+    """
+    결과 디렉토리 총 용량이 max_bytes 이하가 되도록 오래된 실행부터 삭제
+
+    git으로 관리되는 파일을 포함한 실행 디렉토리는 삭제하지 않습니다.
+
+    Args:
+        max_bytes: 허용할 최대 총 용량(bytes), 0 이하이면 아무것도 삭제하지 않음
+        root: 결과 루트 디렉토리
+        keep: 삭제하지 않을 실행 디렉토리 목록 (현재 실행 등)
+
+    Returns:
+        list[Path]: 삭제된 실행 디렉토리 목록
+    """
+    if max_bytes <= 0:
+        return []
+
+    runs = iter_run_dirs(root)
+    sizes = {run: _dir_size(run) for run in runs}
+    total = sum(sizes.values())
+    keep = {Path(k).resolve() for k in keep}
+    tracked = tracked_run_dirs(root) if total > max_bytes else set()
+    removed = []
+    for run in runs:
+        if total <= max_bytes:
+            break
+        if run.resolve() in keep or run.name in tracked:
+            continue
+        shutil.rmtree(run, ignore_errors=True)
+        total -= sizes[run]
+        removed.append(run)
+        log.info(f"[RETENTION] 오래된 결과 삭제: {run.name} ({sizes[run] / 1024 / 1024:.1f}MB)")
+    if total > max_bytes:
+        log.warning(f"[RETENTION] 결과 용량이 제한을 초과합니다: {total / 1024 / 1024:.1f}MB")
+    return removed
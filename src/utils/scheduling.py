@@ -0,0 +1,123 @@
+"""실행 이력 기반 pytest-xdist 스케줄러
+
+src/plugins/scheduler.py가 pytest -n 실행에서만 import하여 사용합니다.
+작업 단위 / affinity / 예상 실행 시간 계획은 worker가 계획 파일로 기록합니다.
+"""
+import json
+import logging
+from collections import defaultdict
+
+from xdist.scheduler import LoadScopeScheduling
+
+log = logging.getLogger(__name__)
+
+AFFINITY_RATIO = 0.5
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    예상 실행 시간 기반 LPT + 브라우저 엔진 affinity 스케줄러
+
+    작업 단위(work unit)는 테스트 하나이며, scope가 넓은 파라미터 fixture를 쓰는 모듈은 모듈 전체가 한 단위입니다.
+    worker의 남은 작업이 1건 이하가 되면 다음 작업 단위 하나를 배정합니다.
+    """
+
+    def __init__(self, config, log=None, plan_path=None):
+        """
+        DurationScheduling 초기화
+
+        Args:
+            config: pytest Config 인스턴스
+            log: xdist 로그 Producer
+            plan_path: worker가 기록한 스케줄 계획 파일 경로 (없으면 수집 순서대로 분배)
+        """
+        super().__init__(config, log)
+        self.plan_path = plan_path
+        self.plan = {}
+        self.unit_durations = {}
+        self.unit_affinity = {}
+        self.node_engines = defaultdict(set)
+        self.node_busy = defaultdict(float)
+        self.node_tests = defaultdict(int)
+
+    def _load_plan(self):
+        """worker가 기록한 계획 파일 로드, 없으면 테스트마다 개별 단위 / 실행 시간 미상으로 처리"""
+        try:
+            with open(self.plan_path, encoding="utf-8") as f:
+                self.plan = json.load(f)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning(f"[SCHEDULE] 스케줄 계획 로드 실패, 수집 순서대로 분배합니다: {e}")
+            self.plan = {}
+
+    def _split_scope(self, nodeid):
+        """테스트가 속한 작업 단위 반환"""
+        entry = self.plan.get(nodeid)
+        return entry["unit"] if entry else nodeid
+
+    def schedule(self):
+        """계획 파일로 작업 단위별 예상 실행 시간 / affinity 계산 후 초기 배정"""
+        if self.collection is None and self.collection_is_completed:
+            self._load_plan()
+            for nodeid in next(iter(self.registered_collections.values()), []):
+                unit = self._split_scope(nodeid)
+                entry = self.plan.get(nodeid, {})
+                self.unit_durations[unit] = self.unit_durations.get(unit, 0.0) + entry.get("duration", 0.0)
+                self.unit_affinity.setdefault(unit, entry.get("affinity"))
+            total = sum(self.unit_durations.values())
+            workers = max(1, len(self.nodes))
+            longest = max(self.unit_durations.values(), default=0.0)
+            log.info(f"[SCHEDULE] 작업 단위 {len(self.unit_durations)}건, 예상 합계 {total:.1f}s, worker {workers}개, "
+                     f"예상 최소 makespan {max(longest, total / workers):.1f}s")
+        super().schedule()
+
+    def _pick_unit(self, node):
+        """
+        worker에 배정할 작업 단위 선택
+
+        남은 가장 긴 작업과 worker가 이미 실행한 엔진의 가장 긴 작업을 비교하여,
+        후자가 AFFINITY_RATIO 이상이면 브라우저 재사용을 위해 후자를 선택합니다.
+        """
+        longest = max(self.workqueue, key=lambda unit: self.unit_durations.get(unit, 0.0))
+        engines = self.node_engines[node]
+        affine = [unit for unit in self.workqueue if self.unit_affinity.get(unit) in engines]
+        if affine:
+            best = max(affine, key=lambda unit: self.unit_durations.get(unit, 0.0))
+            if self.unit_durations.get(best, 0.0) >= AFFINITY_RATIO * self.unit_durations.get(longest, 0.0):
+                return best
+        return longest
+
+    def _assign_work_unit(self, node):
+        """선택한 작업 단위를 worker에 배정"""
+        unit = self._pick_unit(node)
+        self.workqueue.move_to_end(unit, last=False)
+        if self.unit_affinity.get(unit):
+            self.node_engines[node].add(self.unit_affinity[unit])
+        super()._assign_work_unit(node)
+
+    def _reschedule(self, node):
+        """worker의 남은 작업이 1건 이하일 때만 다음 작업 배정 (긴 작업이 한 worker에 몰리지 않도록)"""
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+        self._assign_work_unit(node)
+
+    def mark_test_complete(self, node, item_index, duration=0):
+        """worker별 실제 실행 시간 누적"""
+        self.node_busy[node.gateway.id] += duration
+        self.node_tests[node.gateway.id] += 1
+        super().mark_test_complete(node, item_index, duration)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """worker별 실행 테스트 수 / 실행 시간 요약 출력"""
+        if not self.node_busy:
+            return
+        terminalreporter.write_sep("-", "duration scheduling")
+        terminalreporter.write_line(f"{'worker':<8}{'tests':>7}{'busy_s':>10}")
+        for worker in sorted(self.node_busy):
+            terminalreporter.write_line(f"{worker:<8}{self.node_tests[worker]:>7}{self.node_busy[worker]:>10.2f}")
+        busy = self.node_busy.values()
+        terminalreporter.write_line(f"makespan(max busy) {max(busy):.2f}s, ideal {sum(busy) / len(busy):.2f}s")
@@ -0,0 +1,315 @@
+"""API 응답 스키마 검증 유틸리티
+
+postman/todolist_api_schema.json의 응답 스키마를 엔드포인트/상태 코드별 검증 함수로
+한 번만 컴파일하여 캐시합니다. 검증 시에는 스키마 해석 없이 미리 만들어 둔 함수만 호출하므로
+응답 한 건당 수 마이크로초 수준의 비용만 추가됩니다.
+
+지원 키워드: type, enum, required, properties, items, minLength, $ref(#/definitions/...)
+
+    python -m src.utils.schema    # 컬렉션의 Backend 요청 중 스키마가 없는 항목 확인
+"""
+import functools
+import json
+import logging
+import re
+from urllib.parse import urlsplit
+
+from src.utils.env_loader import get_project_root
+
+log = logging.getLogger(__name__)
+
+SCHEMA_PATH = get_project_root() / "postman" / "todolist_api_schema.json"
+COLLECTION_PATH = get_project_root() / "postman" / "todolist_postman_collection.json"
+BACKEND_HOST = "{{BACKEND_BASE_URL}}"
+
+PYTHON_TYPES = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+
+class SchemaValidationError(AssertionError):
+    """API 응답이 스키마와 일치하지 않을 때 발생하는 예외"""
+
+
+def _compile(schema, definitions, cache):
+    """
+    스키마를 검증 함수로 컴파일
+
+    검증 함수는 값을 받아 오류가 없으면 None, 있으면 (상대 경로, 오류 메시지)를 반환합니다.
+    경로 문자열은 오류가 발생한 경우에만 만들어 정상 응답의 검증 비용을 최소화합니다.
+    items 키워드가 있으면 항목 검증 함수를 item_validator 속성으로 함께 제공하여
+    스트리밍 응답을 항목 단위로 검증할 수 있게 합니다.
+
+    Args:
+        schema: JSON 스키마(dict)
+        definitions: $ref 대상 정의 모음
+        cache: $ref 이름별 컴파일 결과 캐시 (재귀 정의 지원)
+
+    Returns:
+        Callable[[Any], Optional[tuple[str, str]]]: 검증 함수
+    """
+    ref = schema.get("$ref")
+    if ref:
+        name = ref.rsplit("/", 1)[-1]
+        if name not in cache:
+            cell = []
+            cache[name] = lambda value: cell[0](value)
+            cell.append(_compile(definitions[name], definitions, cache))
+        return cache[name]
+
+    checks = []
+
+    types = schema.get("type")
+    if types:
+        types = [types] if isinstance(types, str) else types
+        allowed_types = frozenset(t for name in types for t in PYTHON_TYPES[name])
+        expected = "/".join(types)
+
+        def check_type(value):
+            if type(value) in allowed_types:
+                return None
+            return "", f"{expected} 타입이어야 합니다 (실제: {type(value).__name__})"
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value):
+            return None if value in allowed else ("", f"{allowed} 중 하나여야 합니다 (실제: {value!r})")
+        checks.append(check_enum)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_min_length(value):
+            if type(value) is str and len(value) < min_length:
+                return "", f"길이가 {min_length} 이상이어야 합니다"
+            return None
+        checks.append(check_min_length)
+
+    required = tuple(schema.get("required", ()))
+    properties = tuple(
+        (name, _compile(sub_schema, definitions, cache))
+        for name, sub_schema in schema.get("properties", {}).items()
+    )
+    if required or properties:
+        def check_object(value):
+            if type(value) is not dict:
+                return None
+            for name in required:
+                if name not in value:
+                    return "", f"필수 키 '{name}'가 없습니다"
+            for name, validate in properties:
+                if name in value:
+                    error = validate(value[name])
+                    if error:
+                        return f".{name}{error[0]}", error[1]
+            return None
+        checks.append(check_object)
+
+    if "items" in schema:
+        validate_item = _compile(schema["items"], definitions, cache)
+
+        def check_items(value):
+            if type(value) is not list:
+                return None
+            for index, item in enumerate(value):
+                error = validate_item(item)
+                if error:
+                    return f"[{index}]{error[0]}", error[1]
+            return None
+        checks.append(check_items)
+
+    checks = tuple(checks)
+    if len(checks) == 1:
+        validate = checks[0]
+    else:
+        def validate(value):
+            for check in checks:
+                error = check(value)
+                if error:
+                    return error
+            return None
+    if "items" in schema:
+        validate.item_validator = validate_item
+    return validate
+
+
+def _path_pattern(path):
+    """/api/todos/{id} 형태의 경로 템플릿을 정규식으로 변환"""
+    return re.compile("^" + re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(path)) + "$")
+
+
+class SchemaRegistry:
+    """엔드포인트/상태 코드별로 컴파일된 응답 검증 함수 모음"""
+
+    def __init__(self, spec):
+        """
+        SchemaRegistry 초기화
+
+        Args:
+            spec: todolist_api_schema.json 내용
+        """
+        definitions = spec.get("definitions", {})
+        cache = {}
+        self._exact = {}
+        self._templates = []
+        for endpoint in spec.get("endpoints", []):
+            validators = {
+                int(status): _compile(schema, definitions, cache)
+                for status, schema in endpoint.get("responses", {}).items()
+            }
+            method = endpoint["method"].upper()
+            if "{" in endpoint["path"]:
+                self._templates.append((method, _path_pattern(endpoint["path"]), validators))
+            else:
+                self._exact[(method, endpoint["path"])] = validators
+        self.validators_for = functools.lru_cache(maxsize=4096)(self._lookup)
+
+    def _lookup(self, method, path):
+        """
+        요청에 해당하는 상태 코드별 검증 함수 조회
+
+        고정 경로가 템플릿 경로(/api/auth/{provider})보다 우선합니다.
+
+        Args:
+            method: HTTP 메서드
+            path: 요청 경로
+
+        Returns:
+            dict[int, Callable] | None: 상태 코드별 검증 함수, 정의되지 않은 엔드포인트면 None
+        """
+        validators = self._exact.get((method, path))
+        if validators is not None:
+            return validators
+        for template_method, pattern, validators in self._templates:
+            if template_method == method and pattern.match(path):
+                return validators
+        return None
+
+    def validate_response(self, response):
+        """
+        응답 본문 검증
+
+        Args:
+            response: requests Response 객체
+
+        Raises:
+            SchemaValidationError: 본문이 JSON이 아니거나 스키마와 일치하지 않는 경우
+        """
+        method = response.request.method
+        validator = self.validator(method, response.url, response.status_code)
+        if validator is None:
+            return
+        try:
+            error = validator(response.json())
+        except ValueError:
+            error = ("", "JSON 본문이 아닙니다")
+        if error:
+            raise SchemaValidationError(
+                f"{method} {urlsplit(response.url).path} [{response.status_code}] "
+                f"응답 스키마 불일치 - ${error[0]}: {error[1]}")
+
+    def validator(self, method, url, status_code):
+        """
+        요청/상태 코드에 해당하는 검증 함수 반환
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            status_code: 응답 상태 코드
+
+        Returns:
+            Callable | None: 검증 함수, 정의된 스키마가 없으면 None
+        """
+        validators = self.validators_for(method.upper(), urlsplit(url).path.rstrip("/") or "/")
+        if not validators:
+            return None
+        return validators.get(status_code)
+
+    def item_validator(self, method, url, status_code):
+        """
+        배열 응답의 항목 단위 검증 함수 반환 (스트리밍 응답용)
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            status_code: 응답 상태 코드
+
+        Returns:
+            Callable[[int, Any], None] | None: (인덱스, 항목)을 받아 불일치 시
+            SchemaValidationError를 발생시키는 함수, 배열 스키마가 없으면 None
+        """
+        validate_item = getattr(self.validator(method, url, status_code), "item_validator", None)
+        if validate_item is None:
+            return None
+        path = urlsplit(url).path
+
+        def check_item(index, item):
+            error = validate_item(item)
+            if error:
+                raise SchemaValidationError(
+                    f"{method} {path} [{status_code}] 응답 스키마 불일치 - $[{index}]{error[0]}: {error[1]}")
+        return check_item
+
+
+@functools.lru_cache(maxsize=None)
+def get_registry(path=SCHEMA_PATH):
+    """
+    스키마 파일을 로드하여 컴파일한 SchemaRegistry 반환 (경로별 1회)
+
+    Args:
+        path: 스키마 파일 경로
+
+    Returns:
+        SchemaRegistry: 컴파일된 검증 함수 모음
+    """
+    with open(path, encoding="utf-8") as f:
+        registry = SchemaRegistry(json.load(f))
+    log.debug(f"API 응답 스키마 로드 완료: {path}")
+    return registry
+
+
+def missing_endpoints(collection_path=COLLECTION_PATH, schema_path=SCHEMA_PATH):
+    """
+    Postman 컬렉션의 Backend 요청 중 스키마가 정의되지 않은 요청 목록
+
+    Args:
+        collection_path: Postman 컬렉션 경로
+        schema_path: 스키마 파일 경로
+
+    Returns:
+        list[str]: "METHOD /path (요청 이름)" 목록
+    """
+    with open(collection_path, encoding="utf-8") as f:
+        collection = json.load(f)
+    registry = get_registry(schema_path)
+
+    missing = []
+    stack = list(collection.get("item", []))
+    while stack:
+        item = stack.pop(0)
+        if "item" in item:
+            stack.extend(item["item"])
+            continue
+        request = item["request"]
+        raw = request["url"]["raw"]
+        if not raw.startswith(BACKEND_HOST):
+            continue
+        path = re.sub(r"\{\{[^}]+\}\}", "0", raw[len(BACKEND_HOST):].split("?", 1)[0])
+        if registry.validators_for(request["method"].upper(), path) is None:
+            missing.append(f"{request['method']} {path} ({item['name']})")
+    return missing
+
+
+if __name__ == "__main__":
+    missing = missing_endpoints()
+    for line in missing:
+        print(f"스키마 없음: {line}")
+    raise SystemExit(1 if missing else 0)
@@ -0,0 +1,81 @@
+"""테스트 실행 중 발생한 API 호출 / Web 동작 시간 기록 유틸리티
+
+BaseAPI와 BasePage가 요청/동작마다 기록하고, 결과 스트림 플러그인이 테스트 종료 시점에
+수집한 기록을 리포트에 옮긴 뒤 비웁니다.
+"""
+import logging
+
+log = logging.getLogger(__name__)
+
+_api_calls = []
+_web_timings = []
+
+
+def record_api_call(method, url, status_code, elapsed_ms, bytes_received=None, decode_ms=None):
+    """
+    API 호출 시간 기록
+
+    응답 본문을 나중에 읽는 경우(스트리밍, 지연 JSON 디코딩) 호출한 쪽에서
+    반환된 기록의 bytes / decode_ms / elapsed_ms 값을 갱신합니다.
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL
+        status_code: 응답 상태 코드
+        elapsed_ms: 요청 전송부터 응답 본문 수신까지 걸린 네트워크 시간(ms)
+        bytes_received: 응답 본문 크기(bytes)
+        decode_ms: 응답 본문 JSON 디코딩 시간(ms)
+
+    Returns:
+        dict: 추가된 기록
+    """
+    call = {
+        "method": method,
+        "url": url,
+        "status": status_code,
+        "elapsed_ms": round(elapsed_ms, 3),
+        "bytes": bytes_received,
+        "decode_ms": None if decode_ms is None else round(decode_ms, 3),
+    }
+    _api_calls.append(call)
+    return call
+
+
+def drain_api_calls():
+    """
+    기록된 API 호출 목록을 반환하고 비움
+
+    Returns:
+        list[dict]: 마지막 drain 이후 기록된 API 호출 목록
+    """
+    calls = list(_api_calls)
+    _api_calls.clear()
+    return calls
+
+
+def record_web_timing(action, target, elapsed_ms):
+    """
+    Web 동작 시간 기록
+
+    Args:
+        action: 동작 이름 (navigate, load_state 등)
+        target: 동작 대상 (URL, 로드 상태 등)
+        elapsed_ms: 동작에 걸린 시간(ms)
+    """
+    _web_timings.append({
+        "action": action,
+        "target": target,
+        "elapsed_ms": round(elapsed_ms, 3),
+    })
+
+
+def drain_web_timings():
+    """
+    기록된 Web 동작 시간 목록을 반환하고 비움
+
+    Returns:
+        list[dict]: 마지막 drain 이후 기록된 Web 동작 시간 목록
+    """
+    timings = list(_web_timings)
+    _web_timings.clear()
+    return timings
@@ -16,6 +16,14 @@ def test_get_todos():
     check.is_true(isinstance(response.json(), list))
 
 
+def test_stream_todos():
+    """할일 목록 스트리밍 조회 테스트"""
+    api_client = BaseAPI(URL)
+    todo_id = api_client.post("/api/todos", {"title": "Streamed Todo", "completed": False}).json().get("id")
+    streamed = list(api_client.iter_json("/api/todos", chunk_size=256))
+    check.is_in(todo_id, [todo["id"] for todo in streamed])
+
+
 def test_create_todo():
     """새 할일 생성 테스트"""
     api_client = BaseAPI(URL)
@@ -0,0 +1,147 @@
+"""GET /api/todos 목록 크기별 확장성 테스트
+
+할일을 10 / 1k / 10k / 100k건까지 단계적으로 생성하며 단계마다
+API 응답 시간, 응답 크기, JSON 파싱 시간, 스트리밍 조회 시간과 프론트엔드 렌더링 시간, DOM 크기를 측정합니다.
+측정 결과는 Result/<timestamp>/scaling_curve.json에 저장됩니다.
+
+대량 데이터를 생성하므로 RUN_SCALING_TESTS=true 일 때만 실행합니다.
+    RUN_SCALING_TESTS=true SCALING_LEVELS=10,1000 pytest tests/test_scaling.py
+"""
+import json
+import logging
+import os
+import time
+
+import pytest
+import pytest_check as check
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from src.actions.api.base_api import TodoAPI
+from src.actions.web.auth_actions import AuthActions
+from src.locators.web import todo_locators
+from src.utils.result_dir import get_run_dir
+
+pytest_plugins = ["src.plugins.web"]
+
+log = logging.getLogger(__name__)
+
+URL = os.getenv("BACKEND_BASE_URL")
+SCALING_LEVELS = sorted(int(level) for level in os.getenv("SCALING_LEVELS", "10,1000,10000,100000").split(","))
+REPEAT = 3
+RENDER_TIMEOUT_MS = 120_000
+
+pytestmark = [
+    pytest.mark.scaling,
+    pytest.mark.skipif(os.getenv("RUN_SCALING_TESTS", "false").lower() != "true",
+                       reason="RUN_SCALING_TESTS=true 일 때만 실행"),
+]
+
+
+@pytest.fixture(scope="module")
+def scaling_curve(request):
+    """단계별 측정 결과를 모아 모듈 종료 시 scaling_curve.json으로 저장"""
+    curve = {}
+    yield curve
+
+    path = get_run_dir(request.config) / "scaling_curve.json"
+    points = [{"level": level, **curve[level]} for level in sorted(curve)]
+    path.write_text(json.dumps(points, ensure_ascii=False, indent=2), encoding="utf-8")
+    for point in points:
+        log.info(f"[SCALING] {point}")
+    log.info(f"[SCALING] 확장성 곡선 저장: {path}")
+
+
+@pytest.fixture(scope="module")
+def seeded_ids():
+    """테스트 중 생성한 할일 ID 목록, 모듈 종료 시 일괄 삭제"""
+    ids = []
+    yield ids
+    TodoAPI(URL).delete_todos(ids)
+
+
+@pytest.fixture(scope="module", params=SCALING_LEVELS, ids=lambda level: f"{level}")
+def todo_level(request, seeded_ids):
+    """
+    할일 개수를 단계별 목표치까지 증가
+
+    module scope 파라미터이므로 같은 단계의 API / Web 측정이 연속으로 실행되고
+    단계는 오름차순으로 진행되어 생성한 데이터를 다음 단계에서 재사용합니다.
+    """
+    level = request.param
+    api = TodoAPI(URL)
+    current = len(api.get_todos().json())
+    if current < level:
+        seeded_ids.extend(api.seed_todos(level - current, title_prefix=f"Scaling Todo L{level}"))
+    return level
+
+
+def test_todo_list_api_scaling(todo_level, scaling_curve, record_property):
+    """목록 크기별 API 응답 시간 / 응답 크기 / JSON 파싱 시간 / 스트리밍 조회 시간 측정"""
+    api = TodoAPI(URL, validate_schema=False)
+    response_ms, parse_ms = [], []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = api.get_todos()
+        response_ms.append((time.perf_counter() - started) * 1000)
+        check.equal(response.status_code, 200)
+
+        started = time.perf_counter()
+        todos = json.loads(response.content)
+        parse_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    streamed = sum(1 for _ in api.iter_todos())
+    stream_ms = (time.perf_counter() - started) * 1000
+
+    check.greater_equal(len(todos), todo_level)
+    check.equal(streamed, len(todos))
+    point = {
+        "count": len(todos),
+        "api_response_ms": round(min(response_ms), 2),
+        "payload_bytes": len(response.content),
+        "json_parse_ms": round(min(parse_ms), 3),
+        "stream_ms": round(stream_ms, 2),
+    }
+    scaling_curve.setdefault(todo_level, {}).update(point)
+    record_property("scaling", point)
+
+
+def test_todo_list_render_scaling(todo_level, scaling_curve, record_property, web_page):
+    """
+    목록 크기별 프론트엔드 렌더링 시간 / DOM 크기 측정
+
+    로그인(인증 확인 대기)은 측정 전에 끝내고, 메인 페이지 재진입부터 API가 반환하는 할일 수만큼
+    .todo-item이 DOM에 생성될 때까지를 렌더링 시간으로 측정합니다.
+    제한 시간 안에 모두 렌더링되지 않으면(페이지네이션 / 가상 스크롤 등) render_ms 없이 truncated로 기록합니다.
+    """
+    web_page.set_default_timeout(RENDER_TIMEOUT_MS)
+    AuthActions(web_page).setup_jwt_login()
+    expected = len(TodoAPI(URL, validate_schema=False).get_todos().json())
+
+    started = time.perf_counter()
+    web_page.goto(os.getenv("WEB_BASE_URL"))
+    try:
+        web_page.wait_for_function(
+            "([selector, count]) => document.querySelectorAll(selector).length >= count",
+            arg=[todo_locators.TODO_ITEM, expected])
+        render_ms = round((time.perf_counter() - started) * 1000, 2)
+    except PlaywrightTimeoutError:
+        render_ms = None
+        log.warning(f"[SCALING] {RENDER_TIMEOUT_MS}ms 안에 {expected}건이 모두 렌더링되지 않음")
+
+    rendered = web_page.locator(todo_locators.TODO_ITEM).count()
+    dom_nodes = web_page.evaluate("document.getElementsByTagName('*').length")
+    heap_bytes = web_page.evaluate("performance.memory ? performance.memory.usedJSHeapSize : null")
+
+    point = {
+        "render_ms": render_ms,
+        "expected_items": expected,
+        "rendered_items": rendered,
+        "truncated": rendered < expected,
+        "dom_nodes": dom_nodes,
+        "js_heap_bytes": heap_bytes,
+    }
+    scaling_curve.setdefault(todo_level, {}).update(point)
+    record_property("scaling", point)
+    check.greater_equal(expected, todo_level)
+    check.equal(rendered, expected, f"렌더링된 할일 수 불일치: {rendered} / {expected}")
@@ -0,0 +1,36 @@
+"""배포 게이트용 API 스모크 테스트
+
+배포 직후 가장 먼저 깨지는 핵심 경로(백엔드 헬스, JWT 인증, 할일 목록)만 빠르게 확인합니다.
+pytest --gate 실행 시 Web 메인 화면 렌더링 스모크 테스트(tests/test_web.py)와 함께 우선 실행됩니다.
+"""
+import os
+
+import pytest
+import pytest_check as check
+
+from src.actions.api.base_api import BaseAPI, TodoAPI
+
+URL = os.getenv("BACKEND_BASE_URL")
+
+pytestmark = pytest.mark.smoke
+
+
+def test_backend_health():
+    """백엔드 헬스 체크 응답 확인"""
+    response = BaseAPI(URL).get("/health")
+    check.equal(response.status_code, 200)
+    check.equal(response.json().get("status"), "ok")
+
+
+def test_auth_me():
+    """JWT 토큰으로 현재 사용자 조회 확인"""
+    api_client = BaseAPI(URL, headers={"Authorization": f"Bearer {os.getenv('JWT_TOKEN')}"})
+    response = api_client.get("/api/auth/me")
+    check.equal(response.status_code, 200, "JWT 인증(/api/auth/me) 응답 코드가 200이 아닙니다.")
+
+
+def test_todo_list():
+    """할일 목록 조회 확인"""
+    response = TodoAPI(URL).get_todos()
+    check.equal(response.status_code, 200)
+    check.is_true(isinstance(response.json(), list))
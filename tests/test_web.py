@@ -1,10 +1,22 @@
 """Playwright를 사용한 웹 테스트"""
+import pytest
 import pytest_check as check
 
 from src.actions.web.auth_actions import AuthActions
 from src.actions.web.todo_actions import TodoActions
 from src.locators.web import auth_locators
 
+pytest_plugins = ["src.plugins.web"]
+
+
+@pytest.mark.smoke
+def test_main_page_renders(web_page):
+    """JWT 로그인 후 메인 화면과 할일 목록 렌더링 확인 (배포 게이트 스모크)"""
+    auth = AuthActions(web_page)
+    auth.setup_jwt_login()
+    check.is_true(auth.verify_logged_in())
+    check.is_true(TodoActions(web_page).view_todos())
+
 
 def test_add_todo(web_page):
     """새 할일 추가 테스트"""
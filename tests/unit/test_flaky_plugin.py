@@ -0,0 +1,42 @@
+"""Flaky 재실행 / 격리 플러그인 단위 테스트"""
+import pytest
+
+pytest_plugins = ["pytester"]
+
+TEST_MODULE = """
+import pytest
+
+def test_regular():
+    pass
+
+@pytest.mark.quarantine
+def test_marked():
+    pass
+"""
+
+
+@pytest.fixture
+def run_flaky(pytester):
+    """flaky 플러그인만 활성화한 별도 pytest 세션 실행 함수"""
+    def run(source, *args):
+        pytester.makepyfile(source)
+        return pytester.runpytest("-p", "src.plugins.flaky", *args)
+    return run
+
+
+def test_quarantine_only_runs_marked_tests(run_flaky):
+    """--quarantine only는 격리 테스트만 실행"""
+    result = run_flaky(TEST_MODULE, "--quarantine", "only")
+    result.assert_outcomes(passed=1, deselected=1)
+
+
+def test_quarantine_only_without_quarantined_tests_runs_nothing(run_flaky):
+    """격리 테스트가 없으면 --quarantine only는 아무 테스트도 실행하지 않음"""
+    result = run_flaky("def test_a():\n    pass\n\ndef test_b():\n    pass\n", "--quarantine", "only")
+    result.assert_outcomes(deselected=2)
+
+
+def test_quarantine_skip_excludes_marked_tests(run_flaky):
+    """--quarantine skip은 격리 테스트를 제외"""
+    result = run_flaky(TEST_MODULE, "--quarantine", "skip")
+    result.assert_outcomes(passed=1, deselected=1)
@@ -0,0 +1,96 @@
+"""테스트 영향도 선택 플러그인 단위 테스트"""
+import json
+
+import pytest
+
+from src.plugins.browsers import strip_browser_param
+from src.plugins.impact import load_impact_map, parse_diff
+
+pytest_plugins = ["pytester"]
+
+
+@pytest.mark.parametrize("nodeid, expected", [
+    ("tests/test_web.py::test_add", "tests/test_web.py::test_add"),
+    ("tests/test_web.py::test_add[chromium]", "tests/test_web.py::test_add"),
+    ("tests/test_scaling.py::test_render[10-webkit]", "tests/test_scaling.py::test_render[10]"),
+    ("tests/test_scaling.py::test_render[10]", "tests/test_scaling.py::test_render[10]"),
+])
+def test_strip_browser_param(nodeid, expected):
+    """엔진 파라미터만 제거하고 다른 파라미터는 유지"""
+    assert strip_browser_param(nodeid) == expected
+
+
+def test_load_impact_map_merges_engine_entries(tmp_path):
+    """매트릭스 실행으로 기록한 엔진별 항목은 엔진 없는 nodeid 하나로 합침"""
+    path = tmp_path / "impact_map.json"
+    path.write_text(json.dumps({"version": 1, "tests": {
+        "tests/test_web.py::test_add[chromium]": ["TodoActions.add_todo"],
+        "tests/test_web.py::test_add[webkit]": ["TodoActions.add_todo", "todo_locators.TODO_INPUT"],
+        "tests/test_api.py::test_get": ["TodoAPI.get_todos"],
+    }}), encoding="utf-8")
+
+    assert load_impact_map(path) == {
+        "tests/test_web.py::test_add": ["TodoActions.add_todo", "todo_locators.TODO_INPUT"],
+        "tests/test_api.py::test_get": ["TodoAPI.get_todos"],
+    }
+
+
+def test_load_impact_map_missing_file(tmp_path):
+    """맵 파일이 없으면 빈 맵"""
+    assert load_impact_map(tmp_path / "missing.json") == {}
+
+
+def test_parse_diff_line_ranges():
+    """파일별 변경 전/후 라인 범위 추출 (길이 생략 = 1줄, 길이 0 = 해당 쪽 변경 없음)"""
+    diff = "\n".join([
+        "diff --git a/src/a.py b/src/a.py",
+        "--- a/src/a.py",
+        "+++ b/src/a.py",
+        "@@ -3 +3 @@ def f():",
+        "@@ -10,0 +11,2 @@",
+        "@@ -20,3 +22,0 @@",
+        "diff --git a/src/new.py b/src/new.py",
+        "--- /dev/null",
+        "+++ b/src/new.py",
+        "@@ -0,0 +1,4 @@",
+        "diff --git a/src/old.py b/src/old.py",
+        "--- a/src/old.py",
+        "+++ /dev/null",
+        "@@ -1,2 +0,0 @@",
+    ])
+
+    assert parse_diff(diff) == {
+        "src/a.py": {"old_path": "src/a.py", "old": [(3, 3), (20, 22)], "new": [(3, 3), (11, 12)]},
+        "src/new.py": {"old_path": None, "old": [], "new": [(1, 4)]},
+        "src/old.py": {"old_path": "src/old.py", "old": [(1, 2)], "new": []},
+    }
+
+
+def test_record_credits_scoped_fixture_usage_to_every_test(pytester):
+    """module scope fixture가 셋업 중 사용한 심볼은 그 fixture를 요청하는 모든 테스트에 기록"""
+    pytester.makepyfile(test_scoped="""
+        import pytest
+
+        from src.actions.api.base_api import TodoAPI
+
+        @pytest.fixture(scope="module")
+        def api():
+            return TodoAPI("http://127.0.0.1:9", validate_schema=False)
+
+        def test_first(api):
+            pass
+
+        def test_second(api):
+            pass
+
+        def test_without_fixture():
+            pass
+    """)
+    path = pytester.path / "impact_map.json"
+    result = pytester.runpytest("-p", "src.plugins.impact", "--impact-record", "--impact-map", str(path))
+    result.assert_outcomes(passed=3)
+
+    recorded = load_impact_map(path)
+    assert "BaseAPI.__init__" in recorded["test_scoped.py::test_first"]
+    assert "BaseAPI.__init__" in recorded["test_scoped.py::test_second"]
+    assert recorded["test_scoped.py::test_without_fixture"] == []
@@ -0,0 +1,58 @@
+"""결과 디렉토리 보존 정책 단위 테스트"""
+import subprocess
+
+from src.utils.result_dir import enforce_retention, iter_run_dirs, tracked_run_dirs
+
+
+def make_run(root, name, size):
+    run = root / name
+    run.mkdir()
+    (run / "results.jsonl").write_bytes(b"x" * size)
+    return run
+
+
+def test_enforce_retention_removes_oldest_first(tmp_path):
+    """제한 이하가 될 때까지 오래된 실행부터 삭제 (같은 시각은 접미사 순)"""
+    oldest = make_run(tmp_path, "2026-01-01_00-00-00", 100)
+    second = make_run(tmp_path, "2026-01-01_00-00-00_1", 100)
+    newest = make_run(tmp_path, "2026-01-02_00-00-00", 100)
+    (tmp_path / "notes").mkdir()
+
+    assert iter_run_dirs(tmp_path) == [oldest, second, newest]
+    assert enforce_retention(150, root=tmp_path) == [oldest, second]
+    assert iter_run_dirs(tmp_path) == [newest]
+    assert (tmp_path / "notes").exists()
+
+
+def test_enforce_retention_keeps_given_runs(tmp_path):
+    """keep에 지정한 실행은 가장 오래되어도 삭제하지 않음"""
+    current = make_run(tmp_path, "2026-01-01_00-00-00", 100)
+    other = make_run(tmp_path, "2026-01-02_00-00-00", 100)
+
+    assert enforce_retention(100, root=tmp_path, keep=[current]) == [other]
+    assert current.exists()
+
+
+def test_enforce_retention_disabled(tmp_path):
+    """제한이 0 이하이면 삭제하지 않음"""
+    make_run(tmp_path, "2026-01-01_00-00-00", 100)
+    assert enforce_retention(0, root=tmp_path) == []
+
+
+def test_enforce_retention_keeps_tracked_runs(tmp_path):
+    """git으로 관리되는 파일을 포함한 실행은 가장 오래되어도 삭제하지 않음"""
+    baseline = make_run(tmp_path, "2025-12-15_14-10-45", 100)
+    other = make_run(tmp_path, "2026-01-01_00-00-00", 100)
+    make_run(tmp_path, "2026-01-02_00-00-00", 100)
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", baseline.name], cwd=tmp_path, check=True)
+
+    assert tracked_run_dirs(tmp_path) == {baseline.name}
+    assert enforce_retention(200, root=tmp_path) == [other]
+    assert baseline.exists()
+
+
+def test_tracked_run_dirs_outside_git(tmp_path):
+    """git 저장소가 아니면 빈 집합"""
+    make_run(tmp_path, "2026-01-01_00-00-00", 100)
+    assert tracked_run_dirs(tmp_path) == set()
@@ -0,0 +1,16 @@
+"""실행 이력 인덱스 유틸리티 단위 테스트"""
+import pytest
+
+from src.reporting.run_index import percentile
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1), (10, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_nearest_rank(pct, expected):
+    """nearest-rank 방식 백분위수"""
+    assert percentile(list(range(1, 11)), pct) == expected
+
+
+def test_percentile_single_and_empty():
+    """값이 하나면 그 값, 없으면 None"""
+    assert percentile([3.5], 95) == 3.5
+    assert percentile([], 50) is None
@@ -0,0 +1,38 @@
+"""실행 이력 기반 xdist 스케줄러 단위 테스트"""
+from collections import OrderedDict, defaultdict
+
+import pytest
+
+pytest.importorskip("xdist")
+
+from src.utils.scheduling import DurationScheduling  # noqa: E402
+
+
+def make_scheduler(units):
+    """xdist 초기화 없이 작업 큐 / 예상 실행 시간 / affinity만 설정한 스케줄러"""
+    scheduler = DurationScheduling.__new__(DurationScheduling)
+    scheduler.workqueue = OrderedDict((unit, {}) for unit in units)
+    scheduler.unit_durations = {unit: duration for unit, (duration, _) in units.items()}
+    scheduler.unit_affinity = {unit: engine for unit, (_, engine) in units.items()}
+    scheduler.node_engines = defaultdict(set)
+    return scheduler
+
+
+def test_pick_longest_first():
+    """실행한 엔진이 없으면 가장 긴 작업 선택"""
+    scheduler = make_scheduler({"api": (1.0, None), "web[firefox]": (5.0, "firefox"), "web[webkit]": (3.0, "webkit")})
+    assert scheduler._pick_unit("gw0") == "web[firefox]"
+
+
+def test_pick_affine_unit():
+    """이미 실행한 엔진의 작업이 가장 긴 작업의 AFFINITY_RATIO 이상이면 그 작업 선택"""
+    scheduler = make_scheduler({"web[firefox]": (5.0, "firefox"), "web[webkit]": (3.0, "webkit")})
+    scheduler.node_engines["gw0"].add("webkit")
+    assert scheduler._pick_unit("gw0") == "web[webkit]"
+
+
+def test_pick_longest_over_short_affine_unit():
+    """이미 실행한 엔진의 작업이 너무 짧으면 LPT 우선"""
+    scheduler = make_scheduler({"web[firefox]": (5.0, "firefox"), "web[webkit]": (1.0, "webkit")})
+    scheduler.node_engines["gw0"].add("webkit")
+    assert scheduler._pick_unit("gw0") == "web[firefox]"
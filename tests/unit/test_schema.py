@@ -0,0 +1,70 @@
+"""API 응답 스키마 컴파일러 단위 테스트"""
+import pytest
+
+from src.utils.schema import SchemaRegistry, SchemaValidationError
+
+SPEC = {
+    "definitions": {
+        "Todo": {
+            "type": "object",
+            "required": ["id", "title"],
+            "properties": {
+                "id": {"type": "integer"},
+                "title": {"type": "string", "minLength": 1},
+                "status": {"enum": ["todo", "done"]},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/Todo"}},
+            },
+        },
+    },
+    "endpoints": [
+        {"method": "get", "path": "/api/todos", "responses": {
+            "200": {"type": "array", "items": {"$ref": "#/definitions/Todo"}}}},
+        {"method": "get", "path": "/api/todos/{id}", "responses": {"200": {"$ref": "#/definitions/Todo"}}},
+        {"method": "get", "path": "/api/todos/count", "responses": {"200": {"type": "integer"}}},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return SchemaRegistry(SPEC)
+
+
+@pytest.mark.parametrize("value", [
+    {"id": 1, "title": "a"},
+    {"id": 1, "title": "a", "status": "done", "children": [{"id": 2, "title": "b", "children": []}]},
+])
+def test_valid_value(registry, value):
+    """스키마와 일치하면 오류 없음"""
+    assert registry.validator("GET", "http://host/api/todos/1", 200)(value) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ([], ("", "object 타입이어야 합니다 (실제: list)")),
+    ({"id": 1}, ("", "필수 키 'title'가 없습니다")),
+    ({"id": True, "title": "a"}, (".id", "integer 타입이어야 합니다 (실제: bool)")),
+    ({"id": 1, "title": ""}, (".title", "길이가 1 이상이어야 합니다")),
+    ({"id": 1, "title": "a", "status": "x"}, (".status", "['todo', 'done'] 중 하나여야 합니다 (실제: 'x')")),
+    ({"id": 1, "title": "a", "children": [{"id": "2", "title": "b"}]},
+     (".children[0].id", "integer 타입이어야 합니다 (실제: str)")),
+])
+def test_error_path(registry, value, expected):
+    """오류 위치(재귀 $ref 포함)와 메시지 반환"""
+    assert registry.validator("GET", "http://host/api/todos/1", 200)(value) == expected
+
+
+def test_lookup(registry):
+    """고정 경로가 템플릿 경로보다 우선하고, 정의되지 않은 엔드포인트 / 상태 코드는 검증하지 않음"""
+    assert registry.validator("get", "http://host/api/todos/count/", 200)(3) is None
+    assert registry.validator("GET", "http://host/api/todos/1", 404) is None
+    assert registry.validator("DELETE", "http://host/api/todos/1", 200) is None
+    assert registry.validator("GET", "http://host/api/users", 200) is None
+
+
+def test_item_validator(registry):
+    """배열 응답은 항목 단위 검증 함수를 제공하고 오류에 항목 인덱스를 포함"""
+    check_item = registry.item_validator("GET", "http://host/api/todos", 200)
+    check_item(0, {"id": 1, "title": "a"})
+    with pytest.raises(SchemaValidationError, match=r"GET /api/todos \[200\] .* \$\[3\]\.title"):
+        check_item(3, {"id": 1, "title": 1})
+    assert registry.item_validator("GET", "http://host/api/todos/1", 200) is None
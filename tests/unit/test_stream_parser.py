@@ -0,0 +1,72 @@
+"""스트리밍 JSON 배열 파서 단위 테스트"""
+import json
+
+import pytest
+
+from src.actions.api.base_api import _iter_json_array
+
+CHUNK_SIZES = (1, 2, 3, 64)
+
+
+class FakeResponse:
+    """iter_content로 본문을 chunk_size 단위로 나눠 주는 응답 (limit 이후를 읽으면 실패)"""
+
+    def __init__(self, body, limit=None):
+        self.body = body
+        self.limit = limit
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            if self.limit is not None and start >= self.limit:
+                raise AssertionError(f"잘못된 항목 이후까지 읽었습니다 (위치 {start})")
+            yield self.body[start:start + chunk_size]
+
+
+def parse(body, chunk_size, limit=None):
+    call = {"elapsed_ms": 0.0}
+    return list(_iter_json_array(FakeResponse(body.encode("utf-8"), limit), call, chunk_size)), call
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("body", [
+    "[]",
+    " [ ] \n",
+    "[[], [[]], {}]",
+    '["]", "[", "a]b[c", "\\"]\\"", {"title": "[,]"}]',
+    '[-4500.25e3, 0, true, false, null, "é한글", "\\u00e9\\ud83d\\ude00"]',
+    '[{"id": 1, "title": "a", "completed": false}, {"id": 22, "title": "bb", "completed": true}]',
+])
+def test_matches_json_loads(body, chunk_size):
+    """청크 크기와 관계없이 json.loads와 같은 항목을 반환"""
+    items, call = parse(body, chunk_size)
+    assert items == json.loads(body)
+    assert call["bytes"] == len(body.encode("utf-8"))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("body", [
+    "[1]garbage",
+    "[1]]",
+    "[1] [2]",
+    "[1,,2]",
+    "[,1]",
+    "[1,]",
+    "[1 2]",
+    "[1}",
+    "[tru]",
+    "[1",
+    '["abc',
+    "",
+    '{"id": 1}',
+])
+def test_rejects_invalid_body(body, chunk_size):
+    """json.loads가 거부하는 본문(배열 뒤 데이터, 빈 항목 등)은 JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        parse(body, chunk_size)
+
+
+@pytest.mark.parametrize("body", ["[1, x, " + "2, " * 1000 + "3]", "[1, 2 3, " + "4, " * 1000 + "5]"])
+def test_fails_before_reading_rest_of_body(body):
+    """배열 중간의 잘못된 항목은 본문 끝까지 읽지 않고 바로 실패"""
+    with pytest.raises(json.JSONDecodeError):
+        parse(body, 4, limit=64)